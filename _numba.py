@@ -0,0 +1,13 @@
+"""
+Optional Numba support shared by the compiled kernels.
+
+njit is numba.njit when Numba is installed. Without it, njit is a no-op
+decorator and the kernels run as plain Python.
+"""
+try:
+    from numba import njit
+except ImportError:  # Numba is optional
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
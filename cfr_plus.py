@@ -10,14 +10,16 @@ Key differences from vanilla CFR:
 """
 import numpy as np
 from typing import Dict, List, Tuple
-from kuhn_poker import GameState, GameConfig, Action, Card
-import random
+from kuhn_poker import GameConfig, GameTree
+from cfr import AverageStrategyMixin, cfr_train
 
 
 class InformationSetPlus:
     """
     Information set for CFR+ algorithm.
     Tracks regrets and strategies with CFR+ specific updates.
+    CFRPlusTrainer keeps the same quantities for all info sets as rows of its
+    regret_sum / strategy_sum arrays.
     """
     def __init__(self, num_actions: int):
         self.num_actions = num_actions
@@ -75,7 +77,7 @@ class InformationSetPlus:
             return np.ones(self.num_actions) / self.num_actions
 
 
-class CFRPlusTrainer:
+class CFRPlusTrainer(AverageStrategyMixin):
     """
     CFR+ trainer for Kuhn Poker.
     
@@ -84,7 +86,7 @@ class CFRPlusTrainer:
     - Weighted averaging with delay parameter
     - Alternating player updates
     """
-    def __init__(self, config: GameConfig, delay: int = 0):
+    def __init__(self, config: GameConfig, delay: int = 0, pruning: bool = False):
         """
         Initialize CFR+ trainer.
         
@@ -93,202 +95,98 @@ class CFRPlusTrainer:
             delay: Averaging delay parameter (d). 
                    Weight w = max{t - d, 0} for iteration t.
                    Typical values: 0 (no delay), 100, 500
+            pruning: Skip subtrees the updating player's opponent reaches with
+                     probability zero (common under Regret-Matching+).
+                     Results are identical to the dense traversal.
         """
         self.config = config
         self.delay = delay
-        self.info_sets: Dict[str, InformationSetPlus] = {}
+        self.pruning = pruning
+        self.tree = GameTree(config)
         self.iteration = 0
+        
+        # Cumulative regrets+ and weighted strategies, one row per tree info set id
+        num_info_sets = self.tree.num_info_sets
+        # (float32: Kuhn needs no double precision and it halves memory traffic)
+        self.regret_sum = np.zeros((num_info_sets, 2), dtype=np.float32)
+        self.strategy_sum = np.zeros((num_info_sets, 2), dtype=np.float32)
+        
+        # Scratch buffers reused by every sweep
+        num_deals, num_nodes = self.tree.num_deals, self.tree.num_nodes
+        self._strategy = np.zeros((num_info_sets, 2), dtype=np.float32)
+        self._reach = np.ones((num_deals, num_nodes, 2))
+        self._utility = np.zeros((num_deals, num_nodes))
     
-    def get_info_set(self, key: str, num_actions: int) -> InformationSetPlus:
-        """Get or create an information set."""
-        if key not in self.info_sets:
-            self.info_sets[key] = InformationSetPlus(num_actions)
-        return self.info_sets[key]
-    
-    def train(self, num_iterations: int) -> List[float]:
+    def train(self, num_iterations: int, verbose: bool = True) -> np.ndarray:
         """
         Train the CFR+ algorithm for a number of iterations.
         
         CFR+ uses alternating updates: each iteration updates one player.
+        Repeated calls continue from the iterations already run, so the
+        weights and the alternation pick up where the last call stopped.
+        
+        Args:
+            num_iterations: Number of training iterations
+            verbose: Print progress every 1000 iterations
         
         Returns:
-            List of expected game values per iteration (for player 0)
+            Array of expected game values per iteration (for player 0)
         """
-        expected_values = []
-        
-        for t in range(1, num_iterations + 1):
-            self.iteration = t
-            
-            # Calculate weight for this iteration: w = max{t - d, 0}
-            weight = max(t - self.delay, 0)
-            
-            # Deal random cards
-            deck = self.config.get_deck()
-            cards = [deck[0], deck[1]]
-            initial_state = GameState(self.config, cards)
-            
-            # Alternating updates: update one player per iteration
-            # Even iterations: update player 0, odd iterations: update player 1
-            updating_player = (t - 1) % 2
-            
-            # Run CFR+ for the updating player
-            value = self.cfr_plus(
-                state=initial_state,
-                updating_player=updating_player,
-                reach_prob_0=1.0,
-                reach_prob_1=1.0,
-                weight=weight
-            )
-            
-            # Store value from player 0's perspective
-            if updating_player == 0:
-                expected_values.append(value)
-            else:
-                expected_values.append(-value)  # Flip sign for player 1
-            
-            if t % 1000 == 0:
-                print(f"Iteration {t}/{num_iterations} - Expected value: {value:.6f}")
+        tree = self.tree
+        t = np.arange(self.iteration + 1, self.iteration + num_iterations + 1)
+        
+        # Calculate weight for each iteration: w = max{t - d, 0}
+        weights = np.maximum(t - self.delay, 0).astype(np.float64)
+        
+        # Alternating updates: update one player per iteration
+        # Even iterations: update player 0, odd iterations: update player 1
+        updating_players = (t - 1) % 2
+        
+        # Run CFR+ for the updating player (expectation over all deals), with
+        # every iteration inside the compiled training loop. Values are
+        # reported from player 0's perspective.
+        expected_values = cfr_train(
+            tree.decision_nodes, tree.player, tree.children, tree.num_actions,
+            tree.infoset, tree.payoff, tree.deal_prob,
+            self.regret_sum, self.strategy_sum,
+            self._strategy, self._reach, self._utility,
+            updating_players, weights, True, self.pruning
+        )
+        self.iteration += num_iterations
+        
+        # Progress report every 1000 iterations
+        if verbose:
+            for t in range(1000, num_iterations + 1, 1000):
+                print(f"Iteration {t}/{num_iterations} - Expected value: {expected_values[t - 1]:.6f}")
         
         return expected_values
     
-    def cfr_plus(
-        self, 
-        state: GameState, 
-        updating_player: int,
-        reach_prob_0: float, 
-        reach_prob_1: float,
-        weight: float
-    ) -> float:
+    def cfr_plus(self, updating_player: int, weight: float) -> float:
         """
-        Recursive CFR+ algorithm (vector-form, alternating updates).
+        One CFR+ pass (vector-form, alternating updates) over all deals at once.
+        
+        Forward pass computes reach probabilities and accumulates the
+        non-updating player's strategy; backward pass computes utilities and
+        the updating player's regrets. Both are chance-weighted sums over the
+        deals in which an information set is reached, and the CFR+ clipping
+        max{R + regret, 0} is applied to the aggregated regret. The sweep runs
+        in the compiled kernels shared with vanilla CFR.
         
         Args:
-            state: Current game state
             updating_player: Which player's regrets are being updated (0 or 1)
-            reach_prob_0: Reach probability for player 0
-            reach_prob_1: Reach probability for player 1
             weight: Weighting factor w = max{t - d, 0}
         
         Returns:
             Expected utility for the updating player
         """
-        # Terminal state - return payoff
-        if state.is_terminal():
-            return state.get_payoff(player=updating_player)
-        
-        current_player = state.get_current_player()
-        info_set_key = state.get_info_set(current_player)
-        legal_actions = state.get_legal_actions()
-        num_actions = len(legal_actions)
-        
-        # Get or create information set
-        info_set = self.get_info_set(info_set_key, num_actions)
-        strategy = info_set.get_strategy()
-        
-        # If current player is the updating player: regret update pass
-        if current_player == updating_player:
-            # Calculate utilities for each action
-            action_utilities = np.zeros(num_actions)
-            
-            for i, action in enumerate(legal_actions):
-                next_state = state.apply_action(action)
-                
-                if updating_player == 0:
-                    action_utilities[i] = self.cfr_plus(
-                        next_state,
-                        updating_player,
-                        reach_prob_0 * strategy[i],
-                        reach_prob_1,
-                        weight
-                    )
-                else:
-                    action_utilities[i] = self.cfr_plus(
-                        next_state,
-                        updating_player,
-                        reach_prob_0,
-                        reach_prob_1 * strategy[i],
-                        weight
-                    )
-            
-            # Expected utility for this information set
-            expected_utility = np.sum(strategy * action_utilities)
-            
-            # Get opponent's reach probability for regret weighting
-            opponent_reach_prob = reach_prob_1 if updating_player == 0 else reach_prob_0
-            
-            # Update regrets using CFR+ formula: max{R + regret, 0}
-            for i in range(num_actions):
-                regret = action_utilities[i] - expected_utility
-                info_set.add_regret(i, opponent_reach_prob * regret)
-            
-            return expected_utility
-        
-        # Else: opponent is acting - strategy accumulation pass
-        else:
-            # Calculate expected utility and accumulate strategy
-            expected_utility = 0.0
-            
-            # Get current player's reach probability for strategy weighting
-            current_reach_prob = reach_prob_0 if current_player == 0 else reach_prob_1
-            
-            # Update cumulative strategy (weighted)
-            if weight > 0:  # Only accumulate if weight is positive
-                info_set.update_strategy_sum(current_reach_prob, weight)
-            
-            # Traverse all actions
-            for i, action in enumerate(legal_actions):
-                next_state = state.apply_action(action)
-                
-                if current_player == 0:
-                    action_utility = self.cfr_plus(
-                        next_state,
-                        updating_player,
-                        reach_prob_0 * strategy[i],
-                        reach_prob_1,
-                        weight
-                    )
-                else:
-                    action_utility = self.cfr_plus(
-                        next_state,
-                        updating_player,
-                        reach_prob_0,
-                        reach_prob_1 * strategy[i],
-                        weight
-                    )
-                
-                expected_utility += strategy[i] * action_utility
-            
-            return expected_utility
-    
-    def get_strategy_profile(self) -> Dict[str, Dict[str, float]]:
-        """
-        Get the average strategy for all information sets in a readable format.
-        """
-        profile = {}
-        
-        for info_set_key, info_set in self.info_sets.items():
-            avg_strategy = info_set.get_average_strategy()
-            
-            # Determine possible actions based on history
-            history = info_set_key[1:]  # Remove card character
-            
-            if len(history) == 0:
-                action_names = ["CHECK", "BET"]
-            elif history == "c":
-                action_names = ["CHECK", "BET"]
-            elif history == "b":
-                action_names = ["FOLD", "CALL"]
-            elif history == "cb":
-                action_names = ["FOLD", "CALL"]
-            else:
-                action_names = [f"Action{i}" for i in range(len(avg_strategy))]
-            
-            profile[info_set_key] = {
-                action_names[i]: float(avg_strategy[i])
-                for i in range(len(avg_strategy))
-            }
-        
-        return profile
-
-
-
+        tree = self.tree
+        value = cfr_train(
+            tree.decision_nodes, tree.player, tree.children, tree.num_actions,
+            tree.infoset, tree.payoff, tree.deal_prob,
+            self.regret_sum, self.strategy_sum,
+            self._strategy, self._reach, self._utility,
+            np.array([updating_player]), np.array([float(weight)]), True, self.pruning
+        )[0]
+        
+        # The kernel reports player 0's utility
+        return float(value if updating_player == 0 else -value)
@@ -2,23 +2,89 @@
 Comparison script for CFR, CFR+, NormalHedge, and NormalHedge+ algorithms.
 Runs all four algorithms and compares convergence speed and final strategies.
 """
+import os
+import argparse
 import numpy as np
-import matplotlib.pyplot as plt
+import matplotlib
 from kuhn_poker import GameConfig
 from cfr import CFRTrainer
 from cfr_plus import CFRPlusTrainer
 from normal_hedge import NormalHedgeTrainer
 from normal_hedge_plus import NormalHedgePlusTrainer
 import time
+import itertools
+from typing import Optional, Sequence
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 
-def compare_algorithms(config: GameConfig, num_iterations: int = 10000):
+def _nash_reference(config: GameConfig, fallback_values) -> float:
+    """
+    Reference game value that the error curves are measured against.
+    
+    Args:
+        config: Game configuration
+        fallback_values: Per-iteration values of a well-converged run
+    
+    Returns:
+        The analytic Nash equilibrium value -1/18 for standard Kuhn Poker
+        (ante 1, bet 1), otherwise the mean of the last 2000 fallback values
+    """
+    if config.ante == 1 and config.bet_size == 1:
+        return -1/18
+    return float(np.mean(fallback_values[-2000:]))
+
+
+def _warm_up_worker():
+    """
+    Process pool initializer: load the compiled kernels of every algorithm
+    once per worker, so their one-time load is not counted in the timings.
+    """
+    for trainer_class in (CFRTrainer, CFRPlusTrainer, NormalHedgeTrainer, NormalHedgePlusTrainer):
+        trainer_class(GameConfig()).train(1, verbose=False)
+
+
+def _train_one(trainer_class, config: GameConfig, num_iterations: int, **kwargs):
+    """
+    Train one algorithm from scratch (runs in a worker process).
+    
+    Args:
+        trainer_class: Trainer class, e.g. CFRTrainer
+        config: Game configuration
+        num_iterations: Number of training iterations
+        **kwargs: Extra trainer arguments, e.g. delay for CFR+
+    
+    Returns:
+        (trainer, float32 array of per-iteration values, training time in seconds)
+    """
+    # Progress lines from parallel workers would interleave, so turn them off
+    trainer = trainer_class(config, **kwargs)
+    start_time = time.time()
+    values = trainer.train(num_iterations, verbose=False)
+    elapsed_time = time.time() - start_time
+    
+    # Values are only summarized and plotted, so float32 is plenty and halves
+    # the data pickled back to the parent process
+    return trainer, np.asarray(values, dtype=np.float32), elapsed_time
+
+
+def compare_algorithms(config: GameConfig, num_iterations: int = 10000,
+                       delays: Sequence[int] = (0, 100, 500), plot: bool = True, show: bool = False):
     """
     Run CFR, CFR+, NormalHedge, and NormalHedge+ and compare their performance.
     
     Args:
         config: Game configuration
         num_iterations: Number of iterations for each algorithm
+        delays: CFR+ averaging delays to run (one CFR+ run each; the first
+                one is used in the strategy comparison)
+        plot: Draw and save the comparison plot
+        show: Display the comparison plot in a window after saving it
+    
+    Returns:
+        (results, reference_value): results maps each run's label (e.g.
+        'CFR+ (delay=100)') to a dict with its 'trainer', per-iteration
+        'values', training 'time', running average 'prefix_mean' and
+        'prefix_error' from reference_value (see _nash_reference)
     """
     print("="*70)
     print("CFR vs CFR+ vs NormalHedge vs NormalHedge+ COMPARISON")
@@ -29,138 +95,156 @@ def compare_algorithms(config: GameConfig, num_iterations: int = 10000):
     print(f"  Iterations: {num_iterations}")
     print()
     
-    # Run vanilla CFR
-    print("="*70)
-    print("TRAINING VANILLA CFR")
-    print("="*70)
-    start_time = time.time()
-    cfr_trainer = CFRTrainer(config)
-    cfr_values = cfr_trainer.train(num_iterations)
-    cfr_time = time.time() - start_time
+    # The training runs share no state, so they run in worker processes
+    # (trainers are pickled back to this process). At most one worker per
+    # CPU, so the runs do not compete for cores and distort their timings
+    jobs = {
+        'Vanilla CFR': (CFRTrainer, {}),
+        **{f'CFR+ (delay={delay})': (CFRPlusTrainer, {'delay': delay}) for delay in delays},
+        'NormalHedge': (NormalHedgeTrainer, {}),
+        'NormalHedge+': (NormalHedgePlusTrainer, {}),
+    }
     
-    # Run CFR+ with different delay parameters
-    cfr_plus_results = {}
-    delays = [0, 100, 500]
-    
-    for delay in delays:
-        print(f"\n{'='*70}")
-        print(f"TRAINING CFR+ (delay={delay})")
-        print("="*70)
-        start_time = time.time()
-        cfr_plus_trainer = CFRPlusTrainer(config, delay=delay)
-        cfr_plus_values = cfr_plus_trainer.train(num_iterations)
-        cfr_plus_time = time.time() - start_time
-        
-        cfr_plus_results[delay] = {
-            'trainer': cfr_plus_trainer,
-            'values': cfr_plus_values,
-            'time': cfr_plus_time
-        }
-    
-    # Run NormalHedge
-    print(f"\n{'='*70}")
-    print("TRAINING NORMALHEDGE")
     print("="*70)
-    start_time = time.time()
-    nh_trainer = NormalHedgeTrainer(config)
-    nh_values = nh_trainer.train(num_iterations)
-    nh_time = time.time() - start_time
-    
-    # Run NormalHedge+
-    print(f"\n{'='*70}")
-    print("TRAINING NORMALHEDGE+")
+    print(f"TRAINING {len(jobs)} RUNS IN PARALLEL")
     print("="*70)
-    start_time = time.time()
-    nh_plus_trainer = NormalHedgePlusTrainer(config)
-    nh_plus_values = nh_plus_trainer.train(num_iterations)
-    nh_plus_time = time.time() - start_time
+    finished = {}
+    with ProcessPoolExecutor(max_workers=min(len(jobs), os.cpu_count()),
+                             initializer=_warm_up_worker) as executor:
+        futures = {
+            executor.submit(_train_one, trainer_class, config, num_iterations, **kwargs): name
+            for name, (trainer_class, kwargs) in jobs.items()
+        }
+        for future in as_completed(futures):
+            name = futures[future]
+            finished[name] = future.result()
+            print(f"  Finished {name} in {finished[name][2]:.2f}s")
+    
+    # Longest-delay CFR+ is the fallback reference run
+    reference_value = _nash_reference(config, finished[f'CFR+ (delay={delays[-1]})'][1])
+    
+    # Running averages and their errors are computed once here and shared by
+    # every consumer (kept in the original job order)
+    results = {}
+    for name in jobs:
+        trainer, values, elapsed_time = finished[name]
+        prefix_mean = _running_avg(values)
+        results[name] = {
+            'trainer': trainer,
+            'values': values,
+            'time': elapsed_time,
+            'prefix_mean': prefix_mean,
+            'prefix_error': np.abs(prefix_mean - reference_value)
+        }
     
     # Calculate statistics
     print("\n" + "="*70)
     print("RESULTS COMPARISON")
     print("="*70)
     
-    cfr_final = np.mean(cfr_values[-1000:])
-    cfr_std = np.std(cfr_values[-1000:])
-    
-    print(f"\nVanilla CFR:")
-    print(f"  Final value: {cfr_final:.6f} (±{cfr_std:.6f})")
-    print(f"  Training time: {cfr_time:.2f}s")
-    
-    for delay in delays:
-        result = cfr_plus_results[delay]
-        final_value = np.mean(result['values'][-1000:])
-        std_value = np.std(result['values'][-1000:])
-        print(f"\nCFR+ (delay={delay}):")
+    # Last 1000 values of every run as one (num_runs, 1000) array, reduced
+    # along the iteration axis in one pass per statistic
+    tails = np.array([result['values'][-1000:] for result in results.values()],
+                     dtype=np.float64)
+    final_values = tails.mean(axis=1)
+    std_values = tails.std(axis=1)
+    
+    cfr_time = results['Vanilla CFR']['time']
+    for i, (name, result) in enumerate(results.items()):
+        final_value, std_value = final_values[i], std_values[i]
+        print(f"\n{name}:")
         print(f"  Final value: {final_value:.6f} (±{std_value:.6f})")
         print(f"  Training time: {result['time']:.2f}s")
-        print(f"  Speedup vs CFR: {cfr_time / result['time']:.2f}x")
-    
-    nh_final = np.mean(nh_values[-1000:])
-    nh_std = np.std(nh_values[-1000:])
-    print(f"\nNormalHedge:")
-    print(f"  Final value: {nh_final:.6f} (±{nh_std:.6f})")
-    print(f"  Training time: {nh_time:.2f}s")
-    print(f"  Speedup vs CFR: {cfr_time / nh_time:.2f}x")
-    
-    nh_plus_final = np.mean(nh_plus_values[-1000:])
-    nh_plus_std = np.std(nh_plus_values[-1000:])
-    print(f"\nNormalHedge+:")
-    print(f"  Final value: {nh_plus_final:.6f} (±{nh_plus_std:.6f})")
-    print(f"  Training time: {nh_plus_time:.2f}s")
-    print(f"  Speedup vs CFR: {cfr_time / nh_plus_time:.2f}x")
-    print(f"  Speedup vs NormalHedge: {nh_time / nh_plus_time:.2f}x")
+        if name != 'Vanilla CFR':
+            print(f"  Speedup vs CFR: {cfr_time / result['time']:.2f}x")
+    print(f"  Speedup vs NormalHedge: {results['NormalHedge']['time'] / results['NormalHedge+']['time']:.2f}x")
     
     # Plot comparison
-    plot_comparison(cfr_values, cfr_plus_results, delays, nh_values, nh_plus_values, config)
+    if plot:
+        plot_comparison(results, config, show=show)
     
     # Compare strategies
     print("\n" + "="*70)
     print("STRATEGY COMPARISON")
     print("="*70)
-    compare_strategies(cfr_trainer, cfr_plus_results[0]['trainer'], nh_trainer, nh_plus_trainer)
+    compare_strategies(results['Vanilla CFR']['trainer'], results[f'CFR+ (delay={delays[0]})']['trainer'],
+                       results['NormalHedge']['trainer'], results['NormalHedge+']['trainer'])
     
-    return cfr_trainer, cfr_plus_results, nh_trainer, nh_plus_trainer
+    return results, reference_value
 
 
-def plot_comparison(cfr_values, cfr_plus_results, delays, nh_values, nh_plus_values, config):
+def _running_avg(values) -> np.ndarray:
     """
-    Plot convergence comparison between CFR, CFR+, NormalHedge, and NormalHedge+.
+    Running average of a value sequence.
+    
+    Entry i is the mean of values[:i+1], computed with one cumulative sum.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    return np.cumsum(values) / np.arange(1, len(values) + 1, dtype=np.float64)
+
+
+def _downsample(y, n: int = 1000, log: bool = False):
     """
-    iterations = range(1, len(cfr_values) + 1)
+    Pick about n points of a curve for plotting.
     
-    # Calculate running averages
-    def running_average(values):
-        running_avg = []
-        cumsum = 0
-        for i, val in enumerate(values):
-            cumsum += val
-            running_avg.append(cumsum / (i + 1))
-        return running_avg
+    The curves are computed at full resolution, but a figure cannot show more
+    line segments than it has pixels, and every segment costs rendering time.
     
-    cfr_running_avg = running_average(cfr_values)
-    nh_running_avg = running_average(nh_values)
-    nh_plus_running_avg = running_average(nh_plus_values)
+    Args:
+        y: Per-iteration curve (entry i belongs to iteration i + 1)
+        n: Approximate number of points to keep
+        log: Also keep geometrically spaced points, so the steep early part
+             of an error curve on a log axis stays detailed
+    
+    Returns:
+        (iteration numbers, y) at the selected indices (always including both
+        endpoints); the x values are derived from the indices, so no full
+        iteration axis is built
+    """
+    y = np.asarray(y)
+    idx = np.linspace(0, len(y) - 1, n).astype(int)
+    if log:
+        idx = np.concatenate([idx, np.geomspace(1, len(y), n).astype(int) - 1])
+    idx = np.unique(idx)
+    return idx + 1, y[idx]
+
+
+def plot_comparison(results: dict, config: GameConfig, show: bool = False):
+    """
+    Plot convergence comparison between CFR, CFR+, NormalHedge, and NormalHedge+.
+    
+    Args:
+        results: Per-run results from compare_algorithms (uses the
+                 precomputed 'prefix_mean' and 'prefix_error' arrays)
+        config: Game configuration
+        show: Display the figure in a window; otherwise it is closed after
+              being saved to PNG
+    """
+    # Imported here so that importing this module neither loads pyplot nor
+    # picks a backend for the caller (main() chooses it)
+    import matplotlib.pyplot as plt
+    
+    # Line styles; CFR+ runs take the next color for each delay (cycling
+    # when more delays are given than there are colors)
+    styles = {
+        'Vanilla CFR': ('blue', '-'),
+        'NormalHedge': ('purple', '--'),
+        'NormalHedge+': ('magenta', '-.')
+    }
+    cfr_plus_colors = itertools.cycle(['red', 'green', 'orange', 'brown', 'olive', 'teal'])
+    line_styles = {
+        name: styles.get(name) or (next(cfr_plus_colors), '-')
+        for name in results
+    }
     
     # Create figure with subplots
     fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(14, 10))
     
     # Plot 1: Running averages
-    ax1.plot(iterations, cfr_running_avg, label='Vanilla CFR', linewidth=2, color='blue')
-    
-    colors = ['red', 'green', 'orange']
-    for i, delay in enumerate(delays):
-        cfr_plus_running_avg = running_average(cfr_plus_results[delay]['values'])
-        ax1.plot(iterations, cfr_plus_running_avg, 
-                label=f'CFR+ (delay={delay})', linewidth=2, color=colors[i])
-    
-    # Add NormalHedge
-    ax1.plot(iterations, nh_running_avg, label='NormalHedge', linewidth=2, 
-             color='purple', linestyle='--')
-    
-    # Add NormalHedge+
-    ax1.plot(iterations, nh_plus_running_avg, label='NormalHedge+', linewidth=2, 
-             color='magenta', linestyle='-.')
+    for name, result in results.items():
+        color, linestyle = line_styles[name]
+        ax1.plot(*_downsample(result['prefix_mean']), label=name,
+                 linewidth=2, color=color, linestyle=linestyle)
     
     # Add Nash equilibrium reference
     nash_value = -1/18 if (config.ante == 1 and config.bet_size == 1) else None
@@ -174,34 +258,15 @@ def plot_comparison(cfr_values, cfr_plus_results, delays, nh_values, nh_plus_val
     ax1.legend()
     ax1.grid(True, alpha=0.3)
     
-    # Plot 2: Error from final value (convergence speed)
-    # Use the best estimate as reference
-    reference_value = np.mean(cfr_plus_results[delays[-1]]['values'][-2000:])
-    
-    def calculate_error(values, reference):
-        return [abs(np.mean(values[:i+1]) - reference) for i in range(len(values))]
-    
-    cfr_error = calculate_error(cfr_values, reference_value)
-    ax2.plot(iterations, cfr_error, label='Vanilla CFR', linewidth=2, color='blue')
-    
-    for i, delay in enumerate(delays):
-        cfr_plus_error = calculate_error(cfr_plus_results[delay]['values'], reference_value)
-        ax2.plot(iterations, cfr_plus_error, 
-                label=f'CFR+ (delay={delay})', linewidth=2, color=colors[i])
-    
-    # Add NormalHedge error
-    nh_error = calculate_error(nh_values, reference_value)
-    ax2.plot(iterations, nh_error, label='NormalHedge', linewidth=2, 
-             color='purple', linestyle='--')
-    
-    # Add NormalHedge+ error
-    nh_plus_error = calculate_error(nh_plus_values, reference_value)
-    ax2.plot(iterations, nh_plus_error, label='NormalHedge+', linewidth=2, 
-             color='magenta', linestyle='-.')
+    # Plot 2: Error from the reference value (convergence speed)
+    for name, result in results.items():
+        color, linestyle = line_styles[name]
+        ax2.plot(*_downsample(result['prefix_error'], log=True), label=name,
+                 linewidth=2, color=color, linestyle=linestyle)
     
     ax2.set_xlabel('Iteration')
     ax2.set_ylabel('Absolute Error from Reference')
-    ax2.set_title('Convergence Speed: Error from Final Estimate')
+    ax2.set_title('Convergence Speed: Error from Reference Value')
     ax2.set_yscale('log')
     ax2.legend()
     ax2.grid(True, alpha=0.3)
@@ -209,20 +274,21 @@ def plot_comparison(cfr_values, cfr_plus_results, delays, nh_values, nh_plus_val
     plt.tight_layout()
     plt.savefig('cfr_vs_cfr_plus_vs_normalhedge_comparison.png', dpi=300, bbox_inches='tight')
     print(f"\nComparison plot saved to: cfr_vs_cfr_plus_vs_normalhedge_comparison.png")
-    plt.show()
+    if show:
+        plt.show()
+    plt.close(fig)
 
 
 def compare_strategies(cfr_trainer, cfr_plus_trainer, nh_trainer, nh_plus_trainer):
     """
     Compare the learned strategies between CFR, CFR+, NormalHedge, and NormalHedge+.
     """
-    cfr_profile = cfr_trainer.get_strategy_profile()
-    cfr_plus_profile = cfr_plus_trainer.get_strategy_profile()
-    nh_profile = nh_trainer.get_strategy_profile()
-    nh_plus_profile = nh_plus_trainer.get_strategy_profile()
-    
-    # Compare key information sets
+    # Compare key information sets (only these are normalized)
     key_info_sets = ['J', 'Q', 'K', 'Jb', 'Qb', 'Kb']
+    cfr_profile = cfr_trainer.get_strategy_for(key_info_sets)
+    cfr_plus_profile = cfr_plus_trainer.get_strategy_for(key_info_sets)
+    nh_profile = nh_trainer.get_strategy_for(key_info_sets)
+    nh_plus_profile = nh_plus_trainer.get_strategy_for(key_info_sets)
     
     print("\nKey Strategy Differences:")
     print("-" * 70)
@@ -237,24 +303,20 @@ def compare_strategies(cfr_trainer, cfr_plus_trainer, nh_trainer, nh_plus_traine
             nh_strategy = nh_profile[info_set_key]
             nh_plus_strategy = nh_plus_profile[info_set_key]
             
-            # Calculate strategy differences
+            # One row per algorithm, one column per action (CFR is row 0)
             actions = list(cfr_strategy.keys())
-            max_diff_cfr_plus = 0
-            max_diff_nh = 0
-            max_diff_nh_plus = 0
+            probs = np.array([
+                [strategy.get(action, 0) for action in actions]
+                for strategy in (cfr_strategy, cfr_plus_strategy, nh_strategy, nh_plus_strategy)
+            ])
+            
+            # Differences from CFR for all algorithms and actions at once
+            diffs = np.abs(probs[1:] - probs[0])
+            max_diff_cfr_plus, max_diff_nh, max_diff_nh_plus = diffs.max(axis=1)
             
-            for action in actions:
-                cfr_prob = cfr_strategy[action]
-                cfr_plus_prob = cfr_plus_strategy.get(action, 0)
-                nh_prob = nh_strategy.get(action, 0)
-                nh_plus_prob = nh_plus_strategy.get(action, 0)
-                diff_plus = abs(cfr_prob - cfr_plus_prob)
-                diff_nh = abs(cfr_prob - nh_prob)
-                diff_nh_plus = abs(cfr_prob - nh_plus_prob)
-                max_diff_cfr_plus = max(max_diff_cfr_plus, diff_plus)
-                max_diff_nh = max(max_diff_nh, diff_nh)
-                max_diff_nh_plus = max(max_diff_nh_plus, diff_nh_plus)
-                
+            for j, action in enumerate(actions):
+                cfr_prob, cfr_plus_prob, nh_prob, nh_plus_prob = probs[:, j]
+                diff_plus, diff_nh, diff_nh_plus = diffs[:, j]
                 print(f"  {action:6s}: CFR={cfr_prob:.4f}, CFR+={cfr_plus_prob:.4f}, "
                       f"NH={nh_prob:.4f}, NH+={nh_plus_prob:.4f}")
                 print(f"          Δ(CFR+)={diff_plus:.4f}, Δ(NH)={diff_nh:.4f}, Δ(NH+)={diff_nh_plus:.4f}")
@@ -267,64 +329,93 @@ def compare_strategies(cfr_trainer, cfr_plus_trainer, nh_trainer, nh_plus_traine
                 print(f"  ⚠ Some significant differences")
 
 
-def convergence_rate_analysis(config: GameConfig, iteration_counts: list):
+def convergence_rate_analysis(config: GameConfig, iteration_counts: list,
+                              reference_value: Optional[float] = None, plot: bool = True,
+                              show: bool = False, verbose: bool = True):
     """
     Analyze convergence rate at different iteration counts.
+    
+    Args:
+        config: Game configuration
+        iteration_counts: Iteration counts at which to measure the error
+        reference_value: Value to measure errors against; defaults to
+                         _nash_reference with this analysis' CFR+ run
+        plot: Draw and save the convergence rate plot
+        show: Display the plot in a window after saving it
+        verbose: Print the per-count results table
+    
+    Returns:
+        Dict mapping algorithm name to its array of errors, one per count
     """
     print("\n" + "="*70)
     print("CONVERGENCE RATE ANALYSIS")
     print("="*70)
     
-    cfr_errors = []
-    cfr_plus_errors = []
-    nh_errors = []
-    nh_plus_errors = []
-    reference_value = -1/18 if (config.ante == 1 and config.bet_size == 1) else None
+    n = len(iteration_counts)
+    cfr_errors = np.empty(n)
+    cfr_plus_errors = np.empty(n)
+    nh_errors = np.empty(n)
+    nh_plus_errors = np.empty(n)
     
-    for num_iter in iteration_counts:
-        print(f"\nTesting with {num_iter} iterations...")
-        
-        # CFR
-        cfr_trainer = CFRTrainer(config)
-        cfr_values = cfr_trainer.train(num_iter)
-        cfr_final = np.mean(cfr_values[-max(100, num_iter//10):])
-        
-        # CFR+
-        cfr_plus_trainer = CFRPlusTrainer(config, delay=0)
-        cfr_plus_values = cfr_plus_trainer.train(num_iter)
-        cfr_plus_final = np.mean(cfr_plus_values[-max(100, num_iter//10):])
+    # Each training run's values at iteration t do not depend on how many
+    # iterations follow, so train once to the largest count and read every
+    # smaller count off the prefix of the same run
+    max_iter = max(iteration_counts)
+    print(f"\nTraining each algorithm for {max_iter} iterations...")
+    
+    # CFR
+    cfr_trainer = CFRTrainer(config)
+    cfr_values = cfr_trainer.train(max_iter)
+    
+    # CFR+
+    cfr_plus_trainer = CFRPlusTrainer(config, delay=0)
+    cfr_plus_values = cfr_plus_trainer.train(max_iter)
+    
+    # NormalHedge
+    nh_trainer = NormalHedgeTrainer(config)
+    nh_values = nh_trainer.train(max_iter)
+    
+    # NormalHedge+
+    nh_plus_trainer = NormalHedgePlusTrainer(config)
+    nh_plus_values = nh_plus_trainer.train(max_iter)
+    
+    if reference_value is None:
+        reference_value = _nash_reference(config, cfr_plus_values)
+    
+    # Prefix sums of all four runs (with a leading 0), so the mean of any
+    # window values[a:b] is (cumsum[b] - cumsum[a]) / (b - a)
+    cumsum = np.zeros((4, max_iter + 1))
+    np.cumsum([cfr_values, cfr_plus_values, nh_values, nh_plus_values], axis=1,
+              out=cumsum[:, 1:])
+    
+    for k, num_iter in enumerate(iteration_counts):
+        window = min(max(100, num_iter//10), num_iter)
         
-        # NormalHedge
-        nh_trainer = NormalHedgeTrainer(config)
-        nh_values = nh_trainer.train(num_iter)
-        nh_final = np.mean(nh_values[-max(100, num_iter//10):])
+        # Mean of the last `window` values of the first num_iter iterations
+        cfr_final, cfr_plus_final, nh_final, nh_plus_final = (
+            (cumsum[:, num_iter] - cumsum[:, num_iter - window]) / window
+        )
         
-        # NormalHedge+
-        nh_plus_trainer = NormalHedgePlusTrainer(config)
-        nh_plus_values = nh_plus_trainer.train(num_iter)
-        nh_plus_final = np.mean(nh_plus_values[-max(100, num_iter//10):])
+        cfr_errors[k] = abs(cfr_final - reference_value)
+        cfr_plus_errors[k] = abs(cfr_plus_final - reference_value)
+        nh_errors[k] = abs(nh_final - reference_value)
+        nh_plus_errors[k] = abs(nh_plus_final - reference_value)
         
-        if reference_value is not None:
-            cfr_error = abs(cfr_final - reference_value)
-            cfr_plus_error = abs(cfr_plus_final - reference_value)
-            nh_error = abs(nh_final - reference_value)
-            nh_plus_error = abs(nh_plus_final - reference_value)
-            cfr_errors.append(cfr_error)
-            cfr_plus_errors.append(cfr_plus_error)
-            nh_errors.append(nh_error)
-            nh_plus_errors.append(nh_plus_error)
-            
+        if verbose:
+            cfr_error = cfr_errors[k]
+            print(f"\nTesting with {num_iter} iterations...")
             print(f"  CFR:    {cfr_final:.6f}, error: {cfr_error:.6f}")
-            print(f"  CFR+:   {cfr_plus_final:.6f}, error: {cfr_plus_error:.6f}")
-            print(f"  NH:     {nh_final:.6f}, error: {nh_error:.6f}")
-            print(f"  NH+:    {nh_plus_final:.6f}, error: {nh_plus_error:.6f}")
-            print(f"  CFR+ improvement: {(cfr_error - cfr_plus_error) / cfr_error * 100:.1f}%")
-            print(f"  NH improvement: {(cfr_error - nh_error) / cfr_error * 100:.1f}%")
-            print(f"  NH+ improvement: {(cfr_error - nh_plus_error) / cfr_error * 100:.1f}%")
+            print(f"  CFR+:   {cfr_plus_final:.6f}, error: {cfr_plus_errors[k]:.6f}")
+            print(f"  NH:     {nh_final:.6f}, error: {nh_errors[k]:.6f}")
+            print(f"  NH+:    {nh_plus_final:.6f}, error: {nh_plus_errors[k]:.6f}")
+            print(f"  CFR+ improvement: {(cfr_error - cfr_plus_errors[k]) / cfr_error * 100:.1f}%")
+            print(f"  NH improvement: {(cfr_error - nh_errors[k]) / cfr_error * 100:.1f}%")
+            print(f"  NH+ improvement: {(cfr_error - nh_plus_errors[k]) / cfr_error * 100:.1f}%")
     
     # Plot convergence rate
-    if reference_value is not None:
-        plt.figure(figsize=(10, 6))
+    if plot:
+        import matplotlib.pyplot as plt  # Lazily, as in plot_comparison
+        fig = plt.figure(figsize=(10, 6))
         plt.plot(iteration_counts, cfr_errors, 'o-', label='Vanilla CFR', 
                 linewidth=2, markersize=8)
         plt.plot(iteration_counts, cfr_plus_errors, 's-', label='CFR+', 
@@ -334,7 +425,7 @@ def convergence_rate_analysis(config: GameConfig, iteration_counts: list):
         plt.plot(iteration_counts, nh_plus_errors, '^-', label='NormalHedge+', 
                 linewidth=2, markersize=8)
         plt.xlabel('Number of Iterations')
-        plt.ylabel('Error from Nash Equilibrium')
+        plt.ylabel('Error from Reference Value')
         plt.title('Convergence Rate: CFR vs CFR+ vs NormalHedge vs NormalHedge+')
         plt.legend()
         plt.grid(True, alpha=0.3)
@@ -343,36 +434,69 @@ def convergence_rate_analysis(config: GameConfig, iteration_counts: list):
         plt.tight_layout()
         plt.savefig('convergence_rate_comparison.png', dpi=300, bbox_inches='tight')
         print(f"\nConvergence rate plot saved to: convergence_rate_comparison.png")
-        plt.show()
+        if show:
+            plt.show()
+        plt.close(fig)
+    
+    return {
+        'CFR': cfr_errors,
+        'CFR+': cfr_plus_errors,
+        'NormalHedge': nh_errors,
+        'NormalHedge+': nh_plus_errors
+    }
 
 
 def main():
     """
     Main function to run comprehensive CFR vs CFR+ vs NormalHedge vs NormalHedge+ comparison.
     """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--iterations', type=int, default=10000,
+                        help='training iterations per algorithm (default: 10000)')
+    parser.add_argument('--delays', type=int, nargs='+', default=[0, 100, 500],
+                        help='CFR+ averaging delays to compare (default: 0 100 500)')
+    parser.add_argument('--no-plot', action='store_true',
+                        help='only print the results tables, do not draw or save plots')
+    parser.add_argument('--no-convergence-analysis', action='store_true',
+                        help='skip the convergence rate analysis')
+    parser.add_argument('--interactive', action='store_true',
+                        help='show plot windows (default: only save PNG files)')
+    args = parser.parse_args()
+    
+    # Figures are saved to PNG, so render off-screen without a GUI event loop
+    # unless --interactive asks for plot windows (before pyplot is loaded)
+    if not args.interactive:
+        matplotlib.use('Agg')
+    
+    plot = not args.no_plot
+    
     # Configuration
     config = GameConfig(ante=1, bet_size=1)
     
     # Main comparison
-    cfr_trainer, cfr_plus_results, nh_trainer, nh_plus_trainer = compare_algorithms(config, num_iterations=10000)
+    results, reference_value = compare_algorithms(config, num_iterations=args.iterations,
+                                                  delays=args.delays, plot=plot,
+                                                  show=args.interactive)
     
     # Convergence rate analysis
-    print("\n" + "="*70)
-    print("Running convergence rate analysis...")
-    print("="*70)
-    convergence_rate_analysis(config, iteration_counts=[1000, 2000, 5000, 10000, 20000])
+    if not args.no_convergence_analysis:
+        print("\n" + "="*70)
+        print("Running convergence rate analysis...")
+        print("="*70)
+        convergence_rate_analysis(config, iteration_counts=[1000, 2000, 5000, 10000, 20000],
+                                  reference_value=reference_value, plot=plot,
+                                  show=args.interactive)
     
     print("\n" + "="*70)
     print("ANALYSIS COMPLETE")
     print("="*70)
-    print("\nGenerated files:")
-    print("  - cfr_vs_cfr_plus_vs_normalhedge_comparison.png")
-    print("  - convergence_rate_comparison.png")
+    if plot:
+        print("\nGenerated files:")
+        print("  - cfr_vs_cfr_plus_vs_normalhedge_comparison.png")
+        if not args.no_convergence_analysis:
+            print("  - convergence_rate_comparison.png")
     print("\n")
 
 
 if __name__ == "__main__":
     main()
-
-
-
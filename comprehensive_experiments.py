@@ -3,18 +3,36 @@ Comprehensive Experiments for Algorithm Comparison Report
 Tests CFR, CFR+, NormalHedge, and NormalHedge+ under various configurations.
 Generates comparison plots for visualization.
 """
+import os
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # Figures are only saved to files (also in plot workers)
 import matplotlib.pyplot as plt
+from matplotlib.colors import to_rgba
 import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Dict, List, Optional
 from kuhn_poker import GameConfig
 from cfr import CFRTrainer
 from cfr_plus import CFRPlusTrainer
 from normal_hedge import NormalHedgeTrainer
 from normal_hedge_plus import NormalHedgePlusTrainer
+from experiment_cache import load_cached, save_cached
+from _numba import njit  # Numba is optional; the metrics kernel then runs as plain Python
 
-# Suppress iteration printing for cleaner output
-import sys
-from io import StringIO
+# Algorithms in every experiment: trainer class and extra trainer arguments
+ALGORITHMS = {
+    'CFR': (CFRTrainer, {}),
+    'CFR+': (CFRPlusTrainer, {'delay': 0}),
+    'NormalHedge': (NormalHedgeTrainer, {}),
+    'NormalHedge+': (NormalHedgePlusTrainer, {})
+}
+ALG_ORDER = list(ALGORITHMS)
+
+# Resolution of the intermediate figures (override with the PLOT_DPI
+# environment variable); the headline summary figure uses SUMMARY_DPI
+PLOT_DPI = int(os.environ.get('PLOT_DPI', '150'))
+SUMMARY_DPI = 200
 
 # Algorithm colors and styles for consistent plotting
 ALG_COLORS = {
@@ -36,81 +54,217 @@ ALG_MARKERS = {
     'NormalHedge+': '^'
 }
 
+# Bar fill colors: ALG_COLORS at 80% opacity, baked into the RGBA color
+# instead of passing alpha to every bar
+ALG_BAR_COLORS = {alg_name: to_rgba(color, 0.8) for alg_name, color in ALG_COLORS.items()}
+
+# Experiments in bar-chart order, with their tick labels
+CONFIG_ORDER = ['std_10k', 'std_100k', 'lb_10k', 'lb_100k', 'la_10k', 'la_100k', 'sc_10k', 'sc_100k']
+EXPERIMENT_LABELS = {
+    'std_10k': 'Standard\n10K',
+    'std_100k': 'Standard\n100K',
+    'lb_10k': 'Large Bet\n10K',
+    'lb_100k': 'Large Bet\n100K',
+    'la_10k': 'Large Ante\n10K',
+    'la_100k': 'Large Ante\n100K',
+    'sc_10k': 'Scaled\n10K',
+    'sc_100k': 'Scaled\n100K'
+}
+
+
+class TrainedStrategy:
+    """
+    Result of a training run done in a worker process.
+    
+    Stands in for the trainer in the results dicts: only the final strategy
+    profile is sent back to the main process, not the trainer's regret tables.
+    """
+    def __init__(self, profile: Dict[str, Dict[str, float]]):
+        self.profile = profile
+    
+    def get_strategy_profile(self) -> Dict[str, Dict[str, float]]:
+        """Average strategy for all information sets, as the trainer returned it."""
+        return self.profile
+    
+    def get_strategy_for(self, info_set_keys: List[str]) -> Dict[str, Dict[str, float]]:
+        """Average strategy of the given information sets (unknown keys are skipped)."""
+        return {key: self.profile[key] for key in info_set_keys if key in self.profile}
+
 
 def run_silent(trainer_class, config, num_iterations, **kwargs):
-    """Run training silently (without print statements)."""
-    old_stdout = sys.stdout
-    sys.stdout = StringIO()
+    """
+    Run training silently (without progress output).
+    
+    Runs in a worker process; the training time is measured there, so it
+    does not include time spent waiting in the pool. Finished runs are cached
+    on disk (see experiment_cache), so a run done before is loaded instead of
+    retrained (the returned time is then that of the original run).
+    
+    Returns:
+        (values, strategy profile, training time in seconds)
+    """
+    key = (trainer_class.__name__, config.ante, config.bet_size, num_iterations,
+           sorted(kwargs.items()))
+    result = load_cached(key, run_silent)
+    if result is not None:
+        return result
+    
+    trainer = trainer_class(config, **kwargs)
+    start_time = time.perf_counter()
+    values = trainer.train(num_iterations, verbose=False)
+    elapsed_time = time.perf_counter() - start_time
+    # Game values only need float32 for convergence tracking; this halves the
+    # memory of every values / running average array and of the cache files
+    result = (np.asarray(values, dtype=np.float32), trainer.get_strategy_profile(), elapsed_time)
+    save_cached(key, result, run_silent)
+    
+    return result
+
+
+def warm_up_worker():
+    """
+    Process pool initializer: load the compiled kernels of every algorithm
+    once per worker, so their one-time load is not counted in the first
+    training time.
+    """
+    for trainer_class, kwargs in ALGORITHMS.values():
+        trainer_class(GameConfig(), **kwargs).train(1, verbose=False)
+
+
+def submit_experiment(executor: ProcessPoolExecutor, config: GameConfig,
+                      num_iterations: int) -> Dict[str, Future]:
+    """Queue the training runs of all four algorithms for one configuration."""
+    return {
+        alg_name: executor.submit(run_silent, trainer_class, config, num_iterations, **kwargs)
+        for alg_name, (trainer_class, kwargs) in ALGORITHMS.items()
+    }
+
+
+@njit(cache=True)
+def _metrics_kernel(values, nash_value, tail_size, running_avg, error_series):
+    """
+    Convergence metrics of one run in a single pass over values.
     
-    trainer = trainer_class(config, **kwargs) if kwargs else trainer_class(config)
-    start_time = time.time()
-    values = trainer.train(num_iterations)
-    elapsed_time = time.time() - start_time
+    Accumulates in float64 whatever the input dtype, and writes the running
+    average and its distance from nash_value into the (float32) output arrays.
     
-    sys.stdout = old_stdout
-    return trainer, values, elapsed_time
+    Args:
+        values: Per-iteration game values
+        nash_value: Nash equilibrium value
+        tail_size: Number of final iterations used for the final estimate
+        running_avg: Output, running average of values
+        error_series: Output, |running_avg - nash_value|
+    
+    Returns:
+        (sum, sum of squares) of the last tail_size values
+    """
+    n = values.shape[0]
+    tail_start = n - tail_size
+    total = 0.0
+    tail_sum = 0.0
+    tail_sum_sq = 0.0
+    for i in range(n):
+        v = np.float64(values[i])
+        total += v
+        avg = total / (i + 1)
+        running_avg[i] = avg
+        error_series[i] = abs(avg - nash_value)
+        if i >= tail_start:
+            tail_sum += v
+            tail_sum_sq += v * v
+    return tail_sum, tail_sum_sq
 
 
 def compute_metrics(values, nash_value):
     """Compute convergence metrics."""
-    # Use last 10% of iterations for final estimate
-    tail_size = max(100, len(values) // 10)
-    final_value = np.mean(values[-tail_size:])
-    final_std = np.std(values[-tail_size:])
-    error = abs(final_value - nash_value)
+    values = np.ascontiguousarray(values)
+    
+    # Use last 10% of iterations for final estimate. Mean and std come from
+    # the tail sum and sum of squares; game values are of order 1 and tails
+    # are ~1e4 long, so cancellation in s2/n - mean^2 is negligible
+    tail_size = min(max(100, len(values) // 10), len(values))
     
-    # Running average for convergence
-    running_avg = np.cumsum(values) / np.arange(1, len(values) + 1)
+    # Running average for convergence and its distance from Nash (shared by
+    # all convergence plots), stored as float32 like the values
+    running_avg = np.empty(len(values), dtype=np.float32)
+    error_series = np.empty(len(values), dtype=np.float32)
+    s1, s2 = _metrics_kernel(values, float(nash_value), tail_size, running_avg, error_series)
+    
+    final_value = s1 / tail_size
+    final_std = np.sqrt(max(0.0, s2 / tail_size - final_value * final_value))
+    error = abs(final_value - nash_value)
     
     return {
         'final_value': final_value,
         'final_std': final_std,
         'error': error,
-        'running_avg': running_avg
+        'running_avg': running_avg,
+        'error_series': error_series
     }
 
 
-def run_experiment(config_name, config, num_iterations, nash_value):
-    """Run all four algorithms and collect results."""
+def run_experiment(config_name, config, num_iterations, nash_value,
+                   futures: Optional[Dict[str, Future]] = None):
+    """
+    Run all four algorithms and collect results.
+    
+    Args:
+        futures: Training runs already queued with submit_experiment; if
+                 None, they are run here in a private process pool
+    """
     print(f"\n{'='*70}")
     print(f"EXPERIMENT: {config_name}")
     print(f"Ante={config.ante}, Bet Size={config.bet_size}, Iterations={num_iterations}")
     print(f"Nash Equilibrium Value: {nash_value:.6f}")
     print(f"{'='*70}")
     
-    results = {}
+    if futures is None:
+        with ProcessPoolExecutor(max_workers=len(ALGORITHMS),
+                                 initializer=warm_up_worker) as executor:
+            futures = submit_experiment(executor, config, num_iterations)
+            return run_experiment(config_name, config, num_iterations, nash_value, futures)
     
-    # 1. CFR (Baseline)
-    print("\n  Training CFR...", end=" ", flush=True)
-    cfr_trainer, cfr_values, cfr_time = run_silent(CFRTrainer, config, num_iterations)
-    cfr_metrics = compute_metrics(cfr_values, nash_value)
-    results['CFR'] = {'trainer': cfr_trainer, 'values': cfr_values, 'time': cfr_time, **cfr_metrics}
-    print(f"Done ({cfr_time:.2f}s)")
-    
-    # 2. CFR+
-    print("  Training CFR+...", end=" ", flush=True)
-    cfr_plus_trainer, cfr_plus_values, cfr_plus_time = run_silent(CFRPlusTrainer, config, num_iterations, delay=0)
-    cfr_plus_metrics = compute_metrics(cfr_plus_values, nash_value)
-    results['CFR+'] = {'trainer': cfr_plus_trainer, 'values': cfr_plus_values, 'time': cfr_plus_time, **cfr_plus_metrics}
-    print(f"Done ({cfr_plus_time:.2f}s)")
-    
-    # 3. NormalHedge
-    print("  Training NormalHedge...", end=" ", flush=True)
-    nh_trainer, nh_values, nh_time = run_silent(NormalHedgeTrainer, config, num_iterations)
-    nh_metrics = compute_metrics(nh_values, nash_value)
-    results['NormalHedge'] = {'trainer': nh_trainer, 'values': nh_values, 'time': nh_time, **nh_metrics}
-    print(f"Done ({nh_time:.2f}s)")
-    
-    # 4. NormalHedge+
-    print("  Training NormalHedge+...", end=" ", flush=True)
-    nh_plus_trainer, nh_plus_values, nh_plus_time = run_silent(NormalHedgePlusTrainer, config, num_iterations)
-    nh_plus_metrics = compute_metrics(nh_plus_values, nash_value)
-    results['NormalHedge+'] = {'trainer': nh_plus_trainer, 'values': nh_plus_values, 'time': nh_plus_time, **nh_plus_metrics}
-    print(f"Done ({nh_plus_time:.2f}s)")
+    results = {}
+    for alg_name in ALGORITHMS:
+        print(f"  Training {alg_name}...", end=" ", flush=True)
+        values, profile, elapsed_time = futures[alg_name].result()
+        metrics = compute_metrics(values, nash_value)
+        results[alg_name] = {
+            'trainer': TrainedStrategy(profile),
+            'values': values,
+            'time': elapsed_time,
+            **metrics
+        }
+        print(f"Done ({elapsed_time:.2f}s)")
     
     return results
 
 
+def derive_prefix_results(results_full, num_iterations, nash_value):
+    """
+    Results of the first num_iterations iterations of a longer experiment.
+    
+    Training is sequential, so the first k values of a long run are exactly
+    what a k-iteration run reports, and no separate shorter run is needed.
+    There is no 'trainer' entry (the full run's trainer holds the strategy
+    at the end of the full run) and no 'time' entry (the prefix was never
+    timed on its own), so tables and timing plots skip it.
+    
+    Args:
+        results_full: Results dict from run_experiment
+        num_iterations: Length of the prefix
+        nash_value: Nash equilibrium value for the error metrics
+    """
+    results = {}
+    for alg_name, r in results_full.items():
+        values = r['values'][:num_iterations]
+        results[alg_name] = {
+            'values': values,
+            **compute_metrics(values, nash_value)
+        }
+    return results
+
+
 def print_results_table(results, config_name):
     """Print results in a clean table format."""
     print(f"\n{'='*70}")
@@ -120,15 +274,15 @@ def print_results_table(results, config_name):
     print("-" * 62)
     
     cfr_error = results['CFR']['error']
-    cfr_time = results['CFR']['time']
     
-    for alg_name in ['CFR', 'CFR+', 'NormalHedge', 'NormalHedge+']:
+    for alg_name in ALG_ORDER:
         r = results[alg_name]
         improvement = (cfr_error - r['error']) / cfr_error * 100 if cfr_error > 0 else 0
-        speedup = cfr_time / r['time'] if r['time'] > 0 else 0
         
         improvement_str = f"{improvement:+.1f}%" if alg_name != 'CFR' else "baseline"
-        print(f"{alg_name:<15} {r['final_value']:>12.6f} {r['error']:>12.6f} {r['time']:>10.2f} {improvement_str:>10}")
+        # Prefix results (derive_prefix_results) have no measured time
+        time_str = f"{r['time']:.2f}" if 'time' in r else "n/a"
+        print(f"{alg_name:<15} {r['final_value']:>12.6f} {r['error']:>12.6f} {time_str:>10} {improvement_str:>10}")
     
     print("-" * 62)
 
@@ -139,9 +293,15 @@ def print_strategy_comparison(results, info_sets_to_compare):
     print("STRATEGY COMPARISON")
     print(f"{'='*70}")
     
+    # Only the compared information sets are needed; use the trainer's
+    # per-info-set lookup when it has one
     profiles = {}
-    for alg_name in ['CFR', 'CFR+', 'NormalHedge', 'NormalHedge+']:
-        profiles[alg_name] = results[alg_name]['trainer'].get_strategy_profile()
+    for alg_name in ALG_ORDER:
+        trainer = results[alg_name]['trainer']
+        if hasattr(trainer, 'get_strategy_for'):
+            profiles[alg_name] = trainer.get_strategy_for(info_sets_to_compare)
+        else:
+            profiles[alg_name] = trainer.get_strategy_profile()
     
     for info_set in info_sets_to_compare:
         print(f"\n  Information Set: {info_set}")
@@ -152,30 +312,114 @@ def print_strategy_comparison(results, info_sets_to_compare):
             
             for action in actions:
                 line = f"    {action:6s}: "
-                for alg_name in ['CFR', 'CFR+', 'NormalHedge', 'NormalHedge+']:
+                for alg_name in ALG_ORDER:
                     prob = profiles[alg_name].get(info_set, {}).get(action, 0)
                     line += f"{prob:.4f}  "
                 print(line)
 
 
+def _decimate(y, target: int = 8000, log: bool = False):
+    """
+    Thin a per-iteration curve to about `target` points before plotting.
+    
+    A 14-inch figure cannot resolve 100K points per curve, and Agg spends time
+    on every segment (visible or not), so only every k-th point is drawn.
+    
+    Args:
+        y: Per-iteration values (iteration i + 1 at index i)
+        target: Approximate number of points to keep
+        log: Also keep log-spaced iterations, so the steep early part of an
+             error curve on a log axis keeps its detail
+    
+    Returns:
+        (iterations, values) at the kept points
+    """
+    idx = np.arange(0, len(y), max(1, len(y) // target))
+    if log:
+        idx = np.union1d(idx, np.geomspace(1, len(y), target).astype(int) - 1)
+    return idx + 1, np.asarray(y)[idx]
+
+
+def metric_matrix(all_results, exp_names, metric_key):
+    """
+    One metric for every experiment and algorithm as a 2D array.
+    
+    Args:
+        all_results: Dict of experiment name -> results dict
+        exp_names: Experiments to include, in order; missing ones are skipped
+        metric_key: Per-algorithm entry, e.g. 'error' or 'time'
+    
+    Returns:
+        Array of shape (experiments present, len(ALG_ORDER))
+    """
+    return np.array([[all_results[exp][alg_name][metric_key] for alg_name in ALG_ORDER]
+                     for exp in exp_names if exp in all_results]).reshape(-1, len(ALG_ORDER))
+
+
+def _grouped_bar(ax, all_results, exp_names, metric_key, width=0.2):
+    """
+    Draw one bar per algorithm for each experiment, grouped by experiment.
+    
+    Args:
+        ax: Axes to draw on
+        all_results: Dict of experiment name -> results dict
+        exp_names: Experiments to show, in order; missing ones are skipped
+        metric_key: Per-algorithm entry to plot, e.g. 'error' or 'time'
+        width: Width of a single bar
+    
+    Returns:
+        x positions of the groups (one per experiment present)
+    """
+    # (experiments, algorithms) matrix; column i is the bar series of ALG_ORDER[i]
+    heights = metric_matrix(all_results, exp_names, metric_key)
+    x = np.arange(len(heights))
+    
+    for i, alg_name in enumerate(ALG_ORDER):
+        offset = (i - 1.5) * width
+        ax.bar(x + offset, heights[:, i], width,
+               label=alg_name, facecolor=ALG_BAR_COLORS[alg_name])
+    
+    return x
+
+
+# Figures reused between plots of the same size (per process): clearing a
+# figure is much cheaper than creating and tearing down a new one with its
+# Agg canvas
+_FIG_CACHE: Dict[tuple, 'plt.Figure'] = {}
+
+
+def _get_fig(figsize):
+    """
+    Empty figure of the given size, reused from _FIG_CACHE when possible.
+    
+    Plot functions draw on it, save it with fig.savefig and fig.clear() it
+    instead of closing it.
+    """
+    key = tuple(figsize)
+    fig = _FIG_CACHE.get(key)
+    if fig is None:
+        fig = _FIG_CACHE[key] = plt.figure(figsize=figsize)
+    fig.clear()
+    return fig
+
+
 def plot_convergence_comparison(results, config_name, nash_value, filename):
     """
     Plot convergence comparison (running averages) for all algorithms.
     Similar to compare_cfr_variants.py plot.
     """
-    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(14, 10))
-    
-    num_iterations = len(results['CFR']['values'])
-    iterations = range(1, num_iterations + 1)
+    fig = _get_fig((14, 10))
+    ax1, ax2 = fig.subplots(2, 1)
     
     # Plot 1: Running averages
-    for alg_name in ['CFR', 'CFR+', 'NormalHedge', 'NormalHedge+']:
+    for alg_name in ALG_ORDER:
         running_avg = results[alg_name]['running_avg']
-        ax1.plot(iterations, running_avg, 
+        ax1.plot(*_decimate(running_avg), 
                 label=alg_name, 
                 linewidth=2, 
                 color=ALG_COLORS[alg_name],
-                linestyle=ALG_STYLES[alg_name])
+                linestyle=ALG_STYLES[alg_name],
+                rasterized=True)
     
     # Add Nash equilibrium reference line
     ax1.axhline(y=nash_value, color='black', linestyle='--', 
@@ -188,14 +432,13 @@ def plot_convergence_comparison(results, config_name, nash_value, filename):
     ax1.grid(True, alpha=0.3)
     
     # Plot 2: Error from Nash (log scale)
-    for alg_name in ['CFR', 'CFR+', 'NormalHedge', 'NormalHedge+']:
-        running_avg = results[alg_name]['running_avg']
-        error = np.abs(running_avg - nash_value)
-        ax2.plot(iterations, error, 
+    for alg_name in ALG_ORDER:
+        ax2.plot(*_decimate(results[alg_name]['error_series'], log=True), 
                 label=alg_name, 
                 linewidth=2, 
                 color=ALG_COLORS[alg_name],
-                linestyle=ALG_STYLES[alg_name])
+                linestyle=ALG_STYLES[alg_name],
+                rasterized=True)
     
     ax2.set_xlabel('Iteration', fontsize=12)
     ax2.set_ylabel('Absolute Error from Nash', fontsize=12)
@@ -204,47 +447,23 @@ def plot_convergence_comparison(results, config_name, nash_value, filename):
     ax2.legend(fontsize=10)
     ax2.grid(True, alpha=0.3)
     
-    plt.tight_layout()
-    plt.savefig(filename, dpi=300, bbox_inches='tight')
+    fig.tight_layout()
+    fig.savefig(filename, dpi=PLOT_DPI, bbox_inches='tight')
     print(f"  Plot saved: {filename}")
-    plt.close()
+    fig.clear()
 
 
 def plot_error_bar_comparison(all_results, filename):
     """
     Plot bar chart comparing final errors across all configurations.
     """
-    fig, ax = plt.subplots(figsize=(14, 8))
-    
-    # Prepare data
-    configs = []
-    alg_errors = {alg: [] for alg in ['CFR', 'CFR+', 'NormalHedge', 'NormalHedge+']}
-    
-    config_labels = {
-        'std_10k': 'Standard\n10K',
-        'std_100k': 'Standard\n100K',
-        'lb_10k': 'Large Bet\n10K',
-        'lb_100k': 'Large Bet\n100K',
-        'la_10k': 'Large Ante\n10K',
-        'la_100k': 'Large Ante\n100K',
-        'sc_10k': 'Scaled\n10K',
-        'sc_100k': 'Scaled\n100K'
-    }
+    fig = _get_fig((14, 8))
+    ax = fig.add_subplot(111)
     
-    for exp_name in ['std_10k', 'std_100k', 'lb_10k', 'lb_100k', 'la_10k', 'la_100k', 'sc_10k', 'sc_100k']:
-        if exp_name in all_results:
-            configs.append(config_labels[exp_name])
-            for alg_name in ['CFR', 'CFR+', 'NormalHedge', 'NormalHedge+']:
-                alg_errors[alg_name].append(all_results[exp_name][alg_name]['error'])
+    configs = [EXPERIMENT_LABELS[exp] for exp in CONFIG_ORDER if exp in all_results]
     
     # Create grouped bar chart
-    x = np.arange(len(configs))
-    width = 0.2
-    
-    for i, alg_name in enumerate(['CFR', 'CFR+', 'NormalHedge', 'NormalHedge+']):
-        offset = (i - 1.5) * width
-        bars = ax.bar(x + offset, alg_errors[alg_name], width, 
-                     label=alg_name, color=ALG_COLORS[alg_name], alpha=0.8)
+    x = _grouped_bar(ax, all_results, CONFIG_ORDER, 'error')
     
     ax.set_xlabel('Configuration', fontsize=12)
     ax.set_ylabel('Error from Nash Equilibrium', fontsize=12)
@@ -254,47 +473,26 @@ def plot_error_bar_comparison(all_results, filename):
     ax.legend(fontsize=10)
     ax.grid(True, alpha=0.3, axis='y')
     
-    plt.tight_layout()
-    plt.savefig(filename, dpi=300, bbox_inches='tight')
+    fig.tight_layout()
+    fig.savefig(filename, dpi=PLOT_DPI, bbox_inches='tight')
     print(f"  Plot saved: {filename}")
-    plt.close()
+    fig.clear()
 
 
 def plot_timing_comparison(all_results, filename):
     """
     Plot bar chart comparing training times across all configurations.
     """
-    fig, ax = plt.subplots(figsize=(14, 8))
-    
-    # Prepare data
-    configs = []
-    alg_times = {alg: [] for alg in ['CFR', 'CFR+', 'NormalHedge', 'NormalHedge+']}
-    
-    config_labels = {
-        'std_10k': 'Standard\n10K',
-        'std_100k': 'Standard\n100K',
-        'lb_10k': 'Large Bet\n10K',
-        'lb_100k': 'Large Bet\n100K',
-        'la_10k': 'Large Ante\n10K',
-        'la_100k': 'Large Ante\n100K',
-        'sc_10k': 'Scaled\n10K',
-        'sc_100k': 'Scaled\n100K'
-    }
+    fig = _get_fig((14, 8))
+    ax = fig.add_subplot(111)
     
-    for exp_name in ['std_10k', 'std_100k', 'lb_10k', 'lb_100k', 'la_10k', 'la_100k', 'sc_10k', 'sc_100k']:
-        if exp_name in all_results:
-            configs.append(config_labels[exp_name])
-            for alg_name in ['CFR', 'CFR+', 'NormalHedge', 'NormalHedge+']:
-                alg_times[alg_name].append(all_results[exp_name][alg_name]['time'])
+    # Only the trained runs were timed; prefix results have no 'time'
+    timed = [exp for exp in CONFIG_ORDER
+             if exp in all_results and 'time' in all_results[exp]['CFR']]
+    configs = [EXPERIMENT_LABELS[exp] for exp in timed]
     
     # Create grouped bar chart
-    x = np.arange(len(configs))
-    width = 0.2
-    
-    for i, alg_name in enumerate(['CFR', 'CFR+', 'NormalHedge', 'NormalHedge+']):
-        offset = (i - 1.5) * width
-        bars = ax.bar(x + offset, alg_times[alg_name], width, 
-                     label=alg_name, color=ALG_COLORS[alg_name], alpha=0.8)
+    x = _grouped_bar(ax, all_results, timed, 'time')
     
     ax.set_xlabel('Configuration', fontsize=12)
     ax.set_ylabel('Training Time (seconds)', fontsize=12)
@@ -304,30 +502,28 @@ def plot_timing_comparison(all_results, filename):
     ax.legend(fontsize=10)
     ax.grid(True, alpha=0.3, axis='y')
     
-    plt.tight_layout()
-    plt.savefig(filename, dpi=300, bbox_inches='tight')
+    fig.tight_layout()
+    fig.savefig(filename, dpi=PLOT_DPI, bbox_inches='tight')
     print(f"  Plot saved: {filename}")
-    plt.close()
+    fig.clear()
 
 
 def plot_10k_vs_100k_comparison(results_10k, results_100k, config_name, filename):
     """
     Plot comparison between 10K and 100K iterations for the same configuration.
     """
-    fig, axes = plt.subplots(2, 2, figsize=(16, 12))
+    fig = _get_fig((16, 12))
+    axes = fig.subplots(2, 2)
     
     # Top row: 10K iterations
     ax1, ax2 = axes[0]
     
     # Plot 10K running averages
-    num_iter_10k = len(results_10k['CFR']['values'])
-    iterations_10k = range(1, num_iter_10k + 1)
-    
-    for alg_name in ['CFR', 'CFR+', 'NormalHedge', 'NormalHedge+']:
+    for alg_name in ALG_ORDER:
         running_avg = results_10k[alg_name]['running_avg']
-        ax1.plot(iterations_10k, running_avg, 
+        ax1.plot(*_decimate(running_avg), 
                 label=alg_name, linewidth=2, 
-                color=ALG_COLORS[alg_name], linestyle=ALG_STYLES[alg_name])
+                color=ALG_COLORS[alg_name], linestyle=ALG_STYLES[alg_name], rasterized=True)
     
     ax1.set_xlabel('Iteration')
     ax1.set_ylabel('Running Average Value')
@@ -336,12 +532,11 @@ def plot_10k_vs_100k_comparison(results_10k, results_100k, config_name, filename
     ax1.grid(True, alpha=0.3)
     
     # Plot 10K errors
-    for alg_name in ['CFR', 'CFR+', 'NormalHedge', 'NormalHedge+']:
+    for alg_name in ALG_ORDER:
         running_avg = results_10k[alg_name]['running_avg']
-        error = np.abs(running_avg - results_10k['CFR']['running_avg'][-1])
-        ax2.plot(iterations_10k, np.abs(running_avg), 
+        ax2.plot(*_decimate(np.abs(running_avg)), 
                 label=alg_name, linewidth=2,
-                color=ALG_COLORS[alg_name], linestyle=ALG_STYLES[alg_name])
+                color=ALG_COLORS[alg_name], linestyle=ALG_STYLES[alg_name], rasterized=True)
     
     ax2.set_xlabel('Iteration')
     ax2.set_ylabel('|Running Average|')
@@ -352,14 +547,11 @@ def plot_10k_vs_100k_comparison(results_10k, results_100k, config_name, filename
     # Bottom row: 100K iterations
     ax3, ax4 = axes[1]
     
-    num_iter_100k = len(results_100k['CFR']['values'])
-    iterations_100k = range(1, num_iter_100k + 1)
-    
-    for alg_name in ['CFR', 'CFR+', 'NormalHedge', 'NormalHedge+']:
+    for alg_name in ALG_ORDER:
         running_avg = results_100k[alg_name]['running_avg']
-        ax3.plot(iterations_100k, running_avg, 
+        ax3.plot(*_decimate(running_avg), 
                 label=alg_name, linewidth=2,
-                color=ALG_COLORS[alg_name], linestyle=ALG_STYLES[alg_name])
+                color=ALG_COLORS[alg_name], linestyle=ALG_STYLES[alg_name], rasterized=True)
     
     ax3.set_xlabel('Iteration')
     ax3.set_ylabel('Running Average Value')
@@ -368,11 +560,11 @@ def plot_10k_vs_100k_comparison(results_10k, results_100k, config_name, filename
     ax3.grid(True, alpha=0.3)
     
     # Plot 100K errors
-    for alg_name in ['CFR', 'CFR+', 'NormalHedge', 'NormalHedge+']:
+    for alg_name in ALG_ORDER:
         running_avg = results_100k[alg_name]['running_avg']
-        ax4.plot(iterations_100k, np.abs(running_avg), 
+        ax4.plot(*_decimate(np.abs(running_avg)), 
                 label=alg_name, linewidth=2,
-                color=ALG_COLORS[alg_name], linestyle=ALG_STYLES[alg_name])
+                color=ALG_COLORS[alg_name], linestyle=ALG_STYLES[alg_name], rasterized=True)
     
     ax4.set_xlabel('Iteration')
     ax4.set_ylabel('|Running Average|')
@@ -380,17 +572,17 @@ def plot_10k_vs_100k_comparison(results_10k, results_100k, config_name, filename
     ax4.legend()
     ax4.grid(True, alpha=0.3)
     
-    plt.tight_layout()
-    plt.savefig(filename, dpi=300, bbox_inches='tight')
+    fig.tight_layout()
+    fig.savefig(filename, dpi=PLOT_DPI, bbox_inches='tight')
     print(f"  Plot saved: {filename}")
-    plt.close()
+    fig.clear()
 
 
 def plot_final_summary(all_results, filename):
     """
     Create a comprehensive summary plot with multiple subplots.
     """
-    fig = plt.figure(figsize=(18, 14))
+    fig = _get_fig((18, 14))
     
     # Create grid layout
     gs = fig.add_gridspec(3, 2, hspace=0.3, wspace=0.25)
@@ -400,13 +592,7 @@ def plot_final_summary(all_results, filename):
     configs_10k = ['std_10k', 'lb_10k', 'la_10k', 'sc_10k']
     config_labels_10k = ['Standard', 'Large Bet', 'Large Ante', 'Scaled']
     
-    x = np.arange(len(configs_10k))
-    width = 0.2
-    
-    for i, alg_name in enumerate(['CFR', 'CFR+', 'NormalHedge', 'NormalHedge+']):
-        errors = [all_results[exp][alg_name]['error'] for exp in configs_10k if exp in all_results]
-        offset = (i - 1.5) * width
-        ax1.bar(x + offset, errors, width, label=alg_name, color=ALG_COLORS[alg_name], alpha=0.8)
+    x = _grouped_bar(ax1, all_results, configs_10k, 'error')
     
     ax1.set_ylabel('Error from Nash')
     ax1.set_title('Error Comparison: 10K Iterations')
@@ -418,11 +604,7 @@ def plot_final_summary(all_results, filename):
     # Subplot 2: Error comparison bar chart (100K iterations only)
     ax2 = fig.add_subplot(gs[0, 1])
     configs_100k = ['std_100k', 'lb_100k', 'la_100k', 'sc_100k']
-    
-    for i, alg_name in enumerate(['CFR', 'CFR+', 'NormalHedge', 'NormalHedge+']):
-        errors = [all_results[exp][alg_name]['error'] for exp in configs_100k if exp in all_results]
-        offset = (i - 1.5) * width
-        ax2.bar(x + offset, errors, width, label=alg_name, color=ALG_COLORS[alg_name], alpha=0.8)
+    _grouped_bar(ax2, all_results, configs_100k, 'error')
     
     ax2.set_ylabel('Error from Nash')
     ax2.set_title('Error Comparison: 100K Iterations')
@@ -435,11 +617,10 @@ def plot_final_summary(all_results, filename):
     ax3 = fig.add_subplot(gs[1, 0])
     if 'std_100k' in all_results:
         results = all_results['std_100k']
-        iterations = range(1, len(results['CFR']['values']) + 1)
-        for alg_name in ['CFR', 'CFR+', 'NormalHedge', 'NormalHedge+']:
-            ax3.plot(iterations, results[alg_name]['running_avg'], 
+        for alg_name in ALG_ORDER:
+            ax3.plot(*_decimate(results[alg_name]['running_avg']), 
                     label=alg_name, linewidth=2,
-                    color=ALG_COLORS[alg_name], linestyle=ALG_STYLES[alg_name])
+                    color=ALG_COLORS[alg_name], linestyle=ALG_STYLES[alg_name], rasterized=True)
         ax3.axhline(y=-1/18, color='black', linestyle='--', alpha=0.5, label='Nash')
     ax3.set_xlabel('Iteration')
     ax3.set_ylabel('Running Average')
@@ -451,12 +632,10 @@ def plot_final_summary(all_results, filename):
     ax4 = fig.add_subplot(gs[1, 1])
     if 'std_100k' in all_results:
         results = all_results['std_100k']
-        nash_value = -1/18
-        for alg_name in ['CFR', 'CFR+', 'NormalHedge', 'NormalHedge+']:
-            error = np.abs(results[alg_name]['running_avg'] - nash_value)
-            ax4.plot(iterations, error, 
+        for alg_name in ALG_ORDER:
+            ax4.plot(*_decimate(results[alg_name]['error_series'], log=True), 
                     label=alg_name, linewidth=2,
-                    color=ALG_COLORS[alg_name], linestyle=ALG_STYLES[alg_name])
+                    color=ALG_COLORS[alg_name], linestyle=ALG_STYLES[alg_name], rasterized=True)
     ax4.set_xlabel('Iteration')
     ax4.set_ylabel('Error (log scale)')
     ax4.set_title('Convergence Speed: Standard Config (100K)')
@@ -464,43 +643,33 @@ def plot_final_summary(all_results, filename):
     ax4.legend(fontsize=8)
     ax4.grid(True, alpha=0.3)
     
-    # Subplot 5: Timing comparison
+    # Subplot 5: Timing comparison (only the 100K runs are timed)
     ax5 = fig.add_subplot(gs[2, 0])
-    all_configs = ['std_10k', 'std_100k', 'lb_10k', 'lb_100k']
-    config_labels_time = ['Std 10K', 'Std 100K', 'LB 10K', 'LB 100K']
-    x_time = np.arange(len(all_configs))
-    
-    for i, alg_name in enumerate(['CFR', 'CFR+', 'NormalHedge', 'NormalHedge+']):
-        times = [all_results[exp][alg_name]['time'] for exp in all_configs if exp in all_results]
-        offset = (i - 1.5) * width
-        ax5.bar(x_time + offset, times, width, label=alg_name, color=ALG_COLORS[alg_name], alpha=0.8)
+    x_time = _grouped_bar(ax5, all_results, configs_100k, 'time')
     
     ax5.set_ylabel('Time (seconds)')
-    ax5.set_title('Training Time Comparison')
+    ax5.set_title('Training Time Comparison (100K iterations)')
     ax5.set_xticks(x_time)
-    ax5.set_xticklabels(config_labels_time)
+    ax5.set_xticklabels(config_labels_10k)
     ax5.legend(fontsize=8)
     ax5.grid(True, alpha=0.3, axis='y')
     
     # Subplot 6: Improvement over CFR
     ax6 = fig.add_subplot(gs[2, 1])
-    improvements = {}
-    for alg_name in ['CFR+', 'NormalHedge', 'NormalHedge+']:
-        improvements[alg_name] = []
-        for exp in configs_100k:
-            if exp in all_results:
-                cfr_err = all_results[exp]['CFR']['error']
-                alg_err = all_results[exp][alg_name]['error']
-                imp = (cfr_err - alg_err) / cfr_err * 100 if cfr_err > 0 else 0
-                improvements[alg_name].append(imp)
+    # Relative error reduction of every other algorithm (columns 1: of the
+    # error matrix) vs CFR (column 0), in percent; 0 where CFR's error is 0
+    errors = metric_matrix(all_results, configs_100k, 'error')
+    cfr_err = errors[:, :1]
+    improvements = np.divide((cfr_err - errors[:, 1:]) * 100, cfr_err,
+                             out=np.zeros_like(errors[:, 1:]), where=cfr_err > 0)
     
     x_imp = np.arange(len(config_labels_10k))
     width_imp = 0.25
     
-    for i, alg_name in enumerate(['CFR+', 'NormalHedge', 'NormalHedge+']):
+    for i, alg_name in enumerate(ALG_ORDER[1:]):
         offset = (i - 1) * width_imp
-        ax6.bar(x_imp + offset, improvements[alg_name], width_imp, 
-               label=alg_name, color=ALG_COLORS[alg_name], alpha=0.8)
+        ax6.bar(x_imp + offset, improvements[:, i], width_imp, 
+               label=alg_name, facecolor=ALG_BAR_COLORS[alg_name])
     
     ax6.axhline(y=0, color='black', linestyle='-', alpha=0.5)
     ax6.set_ylabel('Improvement over CFR (%)')
@@ -510,12 +679,26 @@ def plot_final_summary(all_results, filename):
     ax6.legend(fontsize=8)
     ax6.grid(True, alpha=0.3, axis='y')
     
-    plt.suptitle('Comprehensive Algorithm Comparison: CFR vs CFR+ vs NormalHedge vs NormalHedge+', 
+    fig.suptitle('Comprehensive Algorithm Comparison: CFR vs CFR+ vs NormalHedge vs NormalHedge+', 
                 fontsize=16, fontweight='bold', y=1.02)
     
-    plt.savefig(filename, dpi=300, bbox_inches='tight')
+    fig.savefig(filename, dpi=SUMMARY_DPI, bbox_inches='tight')
     print(f"  Summary plot saved: {filename}")
-    plt.close()
+    fig.clear()
+
+
+def strip_trainers(results):
+    """Copy of an experiment's results without the (unplotted) trainer entries."""
+    return {
+        alg_name: {key: value for key, value in r.items() if key != 'trainer'}
+        for alg_name, r in results.items()
+    }
+
+
+def render_plot(task):
+    """Draw one figure: task is (plot function, positional arguments)."""
+    plot_function, args = task
+    plot_function(*args)
 
 
 def main():
@@ -528,27 +711,46 @@ def main():
     
     all_results = {}
     
+    config_standard = GameConfig(ante=1, bet_size=1)
+    nash_standard = -1/18  # Theoretical Nash equilibrium value
+    
+    config_large_bet = GameConfig(ante=1, bet_size=2)
+    nash_large_bet = -1/18  # Approximate (exact Nash varies slightly with bet size)
+    
+    config_large_ante = GameConfig(ante=2, bet_size=1)
+    nash_large_ante = -2/18  # Scales with ante
+    
+    config_scaled = GameConfig(ante=2, bet_size=2)
+    nash_scaled = -2/18
+    
+    # All 16 training runs are independent, so queue them up front on one
+    # process pool; the experiments below collect them in order. Only the
+    # 100K runs are trained: each 10K result is the first 10K iterations of
+    # the corresponding 100K run (see derive_prefix_results)
+    executor = ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=warm_up_worker)
+    futures = {
+        exp_name: submit_experiment(executor, config, 100000)
+        for exp_name, config in [('std', config_standard), ('lb', config_large_bet),
+                                 ('la', config_large_ante), ('sc', config_scaled)]
+    }
+    
     # ===== EXPERIMENT SET 1: Standard Configuration =====
     print("\n" + "#" * 70)
     print("# EXPERIMENT SET 1: STANDARD KUHN POKER (Ante=1, Bet=1)")
     print("#" * 70)
     
-    config_standard = GameConfig(ante=1, bet_size=1)
-    nash_standard = -1/18  # Theoretical Nash equilibrium value
-    
-    # 1A: Standard iterations (10,000)
-    results_std_10k = run_experiment(
-        "Standard Config - 10,000 iterations",
-        config_standard, 10000, nash_standard
-    )
-    print_results_table(results_std_10k, "Standard 10K")
-    all_results['std_10k'] = results_std_10k
-    
     # 1B: 10x iterations (100,000)
     results_std_100k = run_experiment(
         "Standard Config - 100,000 iterations (10x)",
-        config_standard, 100000, nash_standard
+        config_standard, 100000, nash_standard,
+        futures['std']
     )
+    
+    # 1A: Standard iterations (10,000): prefix of the 100K run
+    results_std_10k = derive_prefix_results(results_std_100k, 10000, nash_standard)
+    print_results_table(results_std_10k, "Standard 10K")
+    all_results['std_10k'] = results_std_10k
+    
     print_results_table(results_std_100k, "Standard 100K")
     all_results['std_100k'] = results_std_100k
     
@@ -557,22 +759,18 @@ def main():
     print("# EXPERIMENT SET 2: LARGER BET SIZE (Ante=1, Bet=2)")
     print("#" * 70)
     
-    config_large_bet = GameConfig(ante=1, bet_size=2)
-    nash_large_bet = -1/18  # Approximate (exact Nash varies slightly with bet size)
-    
-    # 2A: Standard iterations
-    results_lb_10k = run_experiment(
-        "Large Bet (bet=2) - 10,000 iterations",
-        config_large_bet, 10000, nash_large_bet
+    # 2B: 10x iterations (100,000)
+    results_lb_100k = run_experiment(
+        "Large Bet (bet=2) - 100,000 iterations (10x)",
+        config_large_bet, 100000, nash_large_bet,
+        futures['lb']
     )
+    
+    # 2A: Standard iterations (10,000): prefix of the 100K run
+    results_lb_10k = derive_prefix_results(results_lb_100k, 10000, nash_large_bet)
     print_results_table(results_lb_10k, "Large Bet 10K")
     all_results['lb_10k'] = results_lb_10k
     
-    # 2B: 10x iterations
-    results_lb_100k = run_experiment(
-        "Large Bet (bet=2) - 100,000 iterations (10x)",
-        config_large_bet, 100000, nash_large_bet
-    )
     print_results_table(results_lb_100k, "Large Bet 100K")
     all_results['lb_100k'] = results_lb_100k
     
@@ -581,22 +779,18 @@ def main():
     print("# EXPERIMENT SET 3: LARGER ANTE (Ante=2, Bet=1)")
     print("#" * 70)
     
-    config_large_ante = GameConfig(ante=2, bet_size=1)
-    nash_large_ante = -2/18  # Scales with ante
-    
-    # 3A: Standard iterations
-    results_la_10k = run_experiment(
-        "Large Ante (ante=2) - 10,000 iterations",
-        config_large_ante, 10000, nash_large_ante
+    # 3B: 10x iterations (100,000)
+    results_la_100k = run_experiment(
+        "Large Ante (ante=2) - 100,000 iterations (10x)",
+        config_large_ante, 100000, nash_large_ante,
+        futures['la']
     )
+    
+    # 3A: Standard iterations (10,000): prefix of the 100K run
+    results_la_10k = derive_prefix_results(results_la_100k, 10000, nash_large_ante)
     print_results_table(results_la_10k, "Large Ante 10K")
     all_results['la_10k'] = results_la_10k
     
-    # 3B: 10x iterations
-    results_la_100k = run_experiment(
-        "Large Ante (ante=2) - 100,000 iterations (10x)",
-        config_large_ante, 100000, nash_large_ante
-    )
     print_results_table(results_la_100k, "Large Ante 100K")
     all_results['la_100k'] = results_la_100k
     
@@ -605,22 +799,18 @@ def main():
     print("# EXPERIMENT SET 4: SCALED UP GAME (Ante=2, Bet=2)")
     print("#" * 70)
     
-    config_scaled = GameConfig(ante=2, bet_size=2)
-    nash_scaled = -2/18
-    
-    # 4A: Standard iterations
-    results_sc_10k = run_experiment(
-        "Scaled Up (ante=2, bet=2) - 10,000 iterations",
-        config_scaled, 10000, nash_scaled
+    # 4B: 10x iterations (100,000)
+    results_sc_100k = run_experiment(
+        "Scaled Up (ante=2, bet=2) - 100,000 iterations (10x)",
+        config_scaled, 100000, nash_scaled,
+        futures['sc']
     )
+    
+    # 4A: Standard iterations (10,000): prefix of the 100K run
+    results_sc_10k = derive_prefix_results(results_sc_100k, 10000, nash_scaled)
     print_results_table(results_sc_10k, "Scaled Up 10K")
     all_results['sc_10k'] = results_sc_10k
     
-    # 4B: 10x iterations
-    results_sc_100k = run_experiment(
-        "Scaled Up (ante=2, bet=2) - 100,000 iterations (10x)",
-        config_scaled, 100000, nash_scaled
-    )
     print_results_table(results_sc_100k, "Scaled Up 100K")
     all_results['sc_100k'] = results_sc_100k
     
@@ -631,40 +821,45 @@ def main():
     
     key_info_sets = ['J', 'Q', 'K', 'Jb', 'Qb', 'Kb', 'Jc', 'Qc', 'Kc']
     print_strategy_comparison(results_std_100k, key_info_sets)
+    executor.shutdown()
     
     # ===== GENERATE PLOTS =====
     print("\n" + "#" * 70)
     print("# GENERATING COMPARISON PLOTS")
     print("#" * 70)
     
-    # Convergence plots for each configuration
-    print("\n  Generating convergence plots...")
-    plot_convergence_comparison(results_std_10k, "Standard Config (10K)", nash_standard, 
-                                'exp_convergence_std_10k.png')
-    plot_convergence_comparison(results_std_100k, "Standard Config (100K)", nash_standard, 
-                                'exp_convergence_std_100k.png')
-    plot_convergence_comparison(results_lb_100k, "Large Bet Config (100K)", nash_large_bet, 
-                                'exp_convergence_lb_100k.png')
-    plot_convergence_comparison(results_la_100k, "Large Ante Config (100K)", nash_large_ante, 
-                                'exp_convergence_la_100k.png')
-    plot_convergence_comparison(results_sc_100k, "Scaled Up Config (100K)", nash_scaled, 
-                                'exp_convergence_sc_100k.png')
-    
-    # 10K vs 100K comparison plots
-    print("\n  Generating 10K vs 100K comparison plots...")
-    plot_10k_vs_100k_comparison(results_std_10k, results_std_100k, "Standard Config", 
-                                'exp_10k_vs_100k_standard.png')
-    plot_10k_vs_100k_comparison(results_lb_10k, results_lb_100k, "Large Bet Config", 
-                                'exp_10k_vs_100k_largebet.png')
-    
-    # Error and timing bar charts
-    print("\n  Generating summary bar charts...")
-    plot_error_bar_comparison(all_results, 'exp_error_comparison.png')
-    plot_timing_comparison(all_results, 'exp_timing_comparison.png')
-    
-    # Final comprehensive summary plot
-    print("\n  Generating comprehensive summary plot...")
-    plot_final_summary(all_results, 'exp_comprehensive_summary.png')
+    # Figures are independent, so they are rendered in parallel worker
+    # processes. Workers only get the arrays they plot, not the trainers.
+    plot_results = {
+        exp_name: strip_trainers(exp_results) for exp_name, exp_results in all_results.items()
+    }
+    plot_tasks = [
+        # Convergence plots for each configuration
+        (plot_convergence_comparison, (plot_results['std_10k'], "Standard Config (10K)",
+                                       nash_standard, 'exp_convergence_std_10k.png')),
+        (plot_convergence_comparison, (plot_results['std_100k'], "Standard Config (100K)",
+                                       nash_standard, 'exp_convergence_std_100k.png')),
+        (plot_convergence_comparison, (plot_results['lb_100k'], "Large Bet Config (100K)",
+                                       nash_large_bet, 'exp_convergence_lb_100k.png')),
+        (plot_convergence_comparison, (plot_results['la_100k'], "Large Ante Config (100K)",
+                                       nash_large_ante, 'exp_convergence_la_100k.png')),
+        (plot_convergence_comparison, (plot_results['sc_100k'], "Scaled Up Config (100K)",
+                                       nash_scaled, 'exp_convergence_sc_100k.png')),
+        # 10K vs 100K comparison plots
+        (plot_10k_vs_100k_comparison, (plot_results['std_10k'], plot_results['std_100k'],
+                                       "Standard Config", 'exp_10k_vs_100k_standard.png')),
+        (plot_10k_vs_100k_comparison, (plot_results['lb_10k'], plot_results['lb_100k'],
+                                       "Large Bet Config", 'exp_10k_vs_100k_largebet.png')),
+        # Error and timing bar charts
+        (plot_error_bar_comparison, (plot_results, 'exp_error_comparison.png')),
+        (plot_timing_comparison, (plot_results, 'exp_timing_comparison.png')),
+        # Final comprehensive summary plot
+        (plot_final_summary, (plot_results, 'exp_comprehensive_summary.png')),
+    ]
+    
+    print(f"\n  Generating {len(plot_tasks)} plots...")
+    with ProcessPoolExecutor(max_workers=min(len(plot_tasks), os.cpu_count())) as plot_executor:
+        list(plot_executor.map(render_plot, plot_tasks))
     
     # ===== SUMMARY =====
     print("\n" + "=" * 70)
@@ -2,16 +2,25 @@
 Experiment script for testing different Kuhn Poker configurations.
 This demonstrates how to modify game rules and compare results.
 """
+import argparse
 import numpy as np
-import matplotlib.pyplot as plt
+import matplotlib
 from kuhn_poker import GameConfig
 from cfr import CFRTrainer
 
 
-def experiment_bet_sizes():
+def experiment_bet_sizes(show: bool = False):
     """
     Experiment with different bet sizes and compare convergence.
+    
+    Args:
+        show: Display the figure in a window; otherwise it is closed after
+              being saved to PNG
     """
+    # Imported here so that importing this module neither loads pyplot nor
+    # picks a backend for the caller (main() chooses it)
+    import matplotlib.pyplot as plt
+    
     print("="*70)
     print("EXPERIMENT: Different Bet Sizes")
     print("="*70)
@@ -41,12 +50,9 @@ def experiment_bet_sizes():
     
     # Plot convergence curves
     for bet_size, data in results.items():
-        # Calculate running average
-        running_avg = []
-        cumsum = 0
-        for i, val in enumerate(data['values']):
-            cumsum += val
-            running_avg.append(cumsum / (i + 1))
+        # Calculate running average (one cumulative sum over the values)
+        values = np.asarray(data['values'], dtype=np.float64)
+        running_avg = np.cumsum(values) / np.arange(1, values.size + 1, dtype=np.float64)
         
         ax1.plot(running_avg, label=f'Bet size = {bet_size}', linewidth=2)
     
@@ -69,15 +75,23 @@ def experiment_bet_sizes():
     plt.tight_layout()
     plt.savefig('experiment_bet_sizes.png', dpi=300, bbox_inches='tight')
     print(f"\nPlot saved to: experiment_bet_sizes.png")
-    plt.show()
+    if show:
+        plt.show()
+    plt.close()
     
     return results
 
 
-def experiment_iterations():
+def experiment_iterations(show: bool = False):
     """
     Experiment with different numbers of iterations to see convergence rate.
+    
+    Args:
+        show: Display the figure in a window; otherwise it is closed after
+              being saved to PNG
     """
+    import matplotlib.pyplot as plt  # Lazily, see experiment_bet_sizes
+    
     print("\n" + "="*70)
     print("EXPERIMENT: Convergence Rate Analysis")
     print("="*70)
@@ -111,62 +125,55 @@ def experiment_iterations():
     plt.yscale('log')
     
     # Add theoretical O(1/sqrt(T)) line
-    theoretical_errors = [errors[0] * np.sqrt(iteration_counts[0] / it) for it in iteration_counts]
+    counts = np.asarray(iteration_counts, dtype=np.float64)
+    theoretical_errors = errors[0] * np.sqrt(counts[0] / counts)
     plt.plot(iteration_counts, theoretical_errors, '--', label='O(1/√T) theoretical', linewidth=2)
     plt.legend()
     
     plt.tight_layout()
     plt.savefig('experiment_convergence_rate.png', dpi=300, bbox_inches='tight')
     print(f"\nPlot saved to: experiment_convergence_rate.png")
-    plt.show()
+    if show:
+        plt.show()
+    plt.close()
 
 
-def analyze_strategy_evolution():
+def analyze_strategy_evolution(show: bool = False):
     """
     Show how strategies evolve over time.
+    
+    Args:
+        show: Display the figure in a window; otherwise it is closed after
+              being saved to PNG
     """
+    import matplotlib.pyplot as plt  # Lazily, see experiment_bet_sizes
+    
     print("\n" + "="*70)
     print("EXPERIMENT: Strategy Evolution")
     print("="*70)
     
     config = GameConfig(ante=1, bet_size=1)
     num_iterations = 10000
-    checkpoints = [100, 500, 1000, 2000, 5000, 10000]
-    
-    # We'll track the strategy at specific checkpoints
-    strategies_over_time = {cp: None for cp in checkpoints}
+    checkpoints = [100, 500, 1000, 2000, 5000, num_iterations]
     
     print(f"\nTraining with checkpoints at: {checkpoints}")
     trainer = CFRTrainer(config)
     
-    for i in range(num_iterations):
-        # Deal random cards
-        deck = config.get_deck()
-        cards = [deck[0], deck[1]]
-        
-        # Create initial game state
-        from kuhn_poker import GameState
-        initial_state = GameState(config, cards)
-        
-        # Run CFR
-        trainer.cfr(initial_state, reach_prob_0=1.0, reach_prob_1=1.0)
-        
-        # Save strategy at checkpoints
-        if (i + 1) in checkpoints:
-            strategies_over_time[i + 1] = trainer.get_strategy_profile()
-            print(f"  Checkpoint {i + 1} saved")
-    
     # Analyze a specific information set (e.g., King at start for Player 0)
-    info_set_key = "K"  # King card, no history
+    info_set = "K"  # King card, no history
     bet_probs = []
     
+    # Run CFR (expectation over all deals) between checkpoints inside the
+    # compiled training loop. train() continues from the current regrets and
+    # player alternation, so this is the same as one uninterrupted run.
+    iterations_done = 0
     for checkpoint in checkpoints:
-        strategy = strategies_over_time[checkpoint]
-        if info_set_key in strategy:
-            bet_prob = strategy[info_set_key].get('BET', 0.5)
-            bet_probs.append(bet_prob)
-        else:
-            bet_probs.append(0.5)
+        trainer.train(checkpoint - iterations_done, verbose=False)
+        iterations_done = checkpoint
+        
+        # Save the average strategy at checkpoints (only this info set is normalized)
+        bet_probs.append(trainer.get_strategy_for([info_set])[info_set]['BET'])
+        print(f"  Checkpoint {checkpoint} saved")
     
     # Plot strategy evolution
     plt.figure(figsize=(10, 6))
@@ -182,13 +189,21 @@ def analyze_strategy_evolution():
     plt.tight_layout()
     plt.savefig('experiment_strategy_evolution.png', dpi=300, bbox_inches='tight')
     print(f"\nPlot saved to: experiment_strategy_evolution.png")
-    plt.show()
+    if show:
+        plt.show()
+    plt.close()
 
 
-def compare_initial_strategies():
+def compare_initial_strategies(show: bool = False):
     """
     Compare initial action strategies for all three cards.
+    
+    Args:
+        show: Display the figure in a window; otherwise it is closed after
+              being saved to PNG
     """
+    import matplotlib.pyplot as plt  # Lazily, see experiment_bet_sizes
+    
     print("\n" + "="*70)
     print("EXPERIMENT: Initial Action Strategies by Card")
     print("="*70)
@@ -246,13 +261,25 @@ def compare_initial_strategies():
     plt.tight_layout()
     plt.savefig('experiment_initial_strategies.png', dpi=300, bbox_inches='tight')
     print(f"\nPlot saved to: experiment_initial_strategies.png")
-    plt.show()
+    if show:
+        plt.show()
+    plt.close()
 
 
 def main():
     """
     Run all experiments.
     """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--interactive', action='store_true',
+                        help='show plot windows (default: only save PNG files)')
+    args = parser.parse_args()
+    
+    # Figures are saved to PNG, so render off-screen without a GUI event loop
+    # unless --interactive asks for plot windows (before pyplot is loaded)
+    if not args.interactive:
+        matplotlib.use('Agg')
+    
     print("\n")
     print("="*70)
     print("KUHN POKER CFR EXPERIMENTS")
@@ -265,10 +292,10 @@ def main():
     print("\n")
     
     # Run experiments
-    experiment_bet_sizes()
-    experiment_iterations()
-    analyze_strategy_evolution()
-    compare_initial_strategies()
+    experiment_bet_sizes(show=args.interactive)
+    experiment_iterations(show=args.interactive)
+    analyze_strategy_evolution(show=args.interactive)
+    compare_initial_strategies(show=args.interactive)
     
     print("\n" + "="*70)
     print("ALL EXPERIMENTS COMPLETE")
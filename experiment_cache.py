@@ -0,0 +1,72 @@
+"""
+On-Disk Cache for Experiment Results
+Shared by the experiment scripts, so re-running one (e.g. to tweak plots)
+does not retrain.
+
+Cache entries are keyed by a tuple describing the run (algorithm, game
+config, iteration counts, trainer arguments, ...) plus a hash of the game and
+trainer sources and of the function that builds the cached result, so
+editing an algorithm or the way a script trains and stores a run invalidates
+its results (other edits to the script, e.g. to plots, do not). Delete
+CACHE_DIR to force retraining.
+"""
+import os
+import pickle
+import hashlib
+import inspect
+from functools import lru_cache
+
+_ROOT = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(_ROOT, '.experiment_cache')
+SOURCE_FILES = ['kuhn_poker.py', 'cfr.py', 'cfr_plus.py', 'normal_hedge.py', 'normal_hedge_plus.py']
+
+
+@lru_cache(maxsize=None)
+def source_hash(builder) -> str:
+    """
+    Hash of the game and trainer source files and of the builder function's
+    source (computed once per process and builder).
+    
+    Args:
+        builder: Function that builds the cached results, e.g. run_silent
+    """
+    digest = hashlib.sha256()
+    for filename in SOURCE_FILES:
+        with open(os.path.join(_ROOT, filename), 'rb') as f:
+            digest.update(f.read())
+    digest.update(inspect.getsource(builder).encode())
+    return digest.hexdigest()[:16]
+
+
+def cache_file(key: tuple, builder) -> str:
+    """Path of the cache entry for a run key built by builder."""
+    full_key = repr((*key, source_hash(builder)))
+    return os.path.join(CACHE_DIR, hashlib.sha256(full_key.encode()).hexdigest()[:24] + '.pkl')
+
+
+def load_cached(key: tuple, builder):
+    """
+    Cached result for a run key, or None if this run was not done before.
+    
+    Args:
+        key: Tuple describing the run
+        builder: Function that builds the result (the caller itself)
+    """
+    path = cache_file(key, builder)
+    if not os.path.exists(path):
+        return None
+    with open(path, 'rb') as f:
+        return pickle.load(f)
+
+
+def save_cached(key: tuple, result, builder):
+    """Store the result for a run key built by builder (see load_cached)."""
+    path = cache_file(key, builder)
+    
+    # Write to a temporary file first so a crashed run never leaves a
+    # truncated cache entry behind
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp_file = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_file, 'wb') as f:
+        pickle.dump(result, f)
+    os.replace(tmp_file, path)
@@ -2,6 +2,7 @@
 Interactive Kuhn Poker player - Play against the trained CFR strategy.
 """
 import random
+import bisect
 from kuhn_poker import GameConfig, GameState, Card, Action
 from cfr import CFRTrainer
 import numpy as np
@@ -11,21 +12,37 @@ class KuhnPokerGame:
     """Interactive Kuhn Poker game"""
     
     def __init__(self, trainer: CFRTrainer):
+        """
+        Args:
+            trainer: Trained CFR trainer; its average strategy is read once
+                     here, so train it before creating the game
+        """
         self.trainer = trainer
         self.config = trainer.config
+        
+        # Training is finished during play, so normalize every average
+        # strategy once instead of on each AI decision
+        self.average_strategy = {
+            info_set_key: trainer.get_average_strategy(info_set_key)
+            for info_set_key in trainer.tree.info_set_keys
+        }
+        # Cumulative probabilities for sampling an action with one uniform draw
+        self._cumulative_strategy = {
+            info_set_key: np.cumsum(strategy).tolist()
+            for info_set_key, strategy in self.average_strategy.items()
+        }
     
     def get_action_from_strategy(self, state: GameState, player: int) -> Action:
         """Get an action based on the learned strategy"""
         info_set_key = state.get_info_set(player)
         legal_actions = state.get_legal_actions()
         
-        if info_set_key in self.trainer.info_sets:
-            info_set = self.trainer.info_sets[info_set_key]
-            strategy = info_set.get_average_strategy()
-            
-            # Sample action based on strategy
-            action_idx = np.random.choice(len(legal_actions), p=strategy)
-            return legal_actions[action_idx]
+        cumulative = self._cumulative_strategy.get(info_set_key)
+        if cumulative is not None:
+            # Sample action based on strategy: first action whose cumulative
+            # probability exceeds a uniform draw (clamped against rounding)
+            action_idx = bisect.bisect_right(cumulative, random.random())
+            return legal_actions[min(action_idx, len(legal_actions) - 1)]
         else:
             # Uniform random if not seen
             return random.choice(legal_actions)
@@ -38,8 +55,7 @@ class KuhnPokerGame:
             human_player: Which player is human (0 or 1)
         """
         # Deal cards
-        deck = self.config.get_deck()
-        cards = [deck[0], deck[1]]
+        cards = list(self.config.sample_deal())
         
         print("\n" + "="*60)
         print("NEW GAME")
@@ -90,11 +106,11 @@ class KuhnPokerGame:
         
         return payoff
     
-    def get_human_action(self, state: GameState, legal_actions: list) -> Action:
+    def get_human_action(self, state: GameState, legal_actions: tuple) -> Action:
         """Get action from human player"""
         print(f"Your card: {state.cards[0].name}")
         print(f"History: {state.history if state.history else '(start)'}")
-        print(f"Pot: {state.pot + (state.history.count('b') * self.config.bet_size)} chips")
+        print(f"Pot: {state.get_pot()} chips")
         print()
         print("Legal actions:")
         
@@ -3,26 +3,30 @@ Kuhn Poker Game Implementation
 A simple 3-card poker variant for game theory analysis.
 """
 import random
+import numpy as np
 from typing import List, Dict, Tuple, Optional
-from enum import Enum
+from enum import IntEnum
 
 
-class Action(Enum):
-    """Possible actions in Kuhn Poker"""
+class Action(IntEnum):
+    """
+    Possible actions in Kuhn Poker.
+    
+    An IntEnum, so equality checks and dict lookups (e.g. the per-history
+    caches below) use plain int comparison and hashing instead of going
+    through Enum's Python-level __eq__ / __hash__.
+    """
     CHECK = 0
     BET = 1
     FOLD = 2
     CALL = 3
 
 
-class Card(Enum):
-    """Card values in Kuhn Poker"""
+class Card(IntEnum):
+    """Card values in Kuhn Poker (ordered by rank, like ints)"""
     JACK = 0
     QUEEN = 1
     KING = 2
-    
-    def __lt__(self, other):
-        return self.value < other.value
 
 
 class GameConfig:
@@ -31,16 +35,76 @@ class GameConfig:
         self.ante = ante
         self.bet_size = bet_size
         self.cards = [Card.JACK, Card.QUEEN, Card.KING]
+        # All ordered (card0, card1) deals; each is equally likely
+        self.deals = tuple((c0, c1) for c0 in self.cards for c1 in self.cards if c0 != c1)
     
     def get_deck(self) -> List[Card]:
         """Return a shuffled deck"""
         deck = self.cards.copy()
         random.shuffle(deck)
         return deck
+    
+    def sample_deal(self, rng=random) -> Tuple[Card, Card]:
+        """
+        Deal cards to both players uniformly at random.
+        
+        Same distribution as the first two cards of get_deck(), but one
+        randrange draw from the precomputed deals instead of copying and
+        shuffling the deck.
+        
+        Args:
+            rng: random.Random instance (or the random module) to draw from
+        
+        Returns:
+            (player 0 card, player 1 card)
+        """
+        return self.deals[rng.randrange(len(self.deals))]
+
+
+# Legal actions and successor histories depend only on the history string,
+# so they are computed once per history and shared by every GameState
+_LEGAL_ACTIONS: Dict[str, Tuple[Action, ...]] = {}
+_NEXT_HISTORY: Dict[Tuple[str, Action], str] = {}
+
+# History character of each action and info set character of each card
+_ACTION_CHAR: Dict[Action, str] = {
+    Action.CHECK: 'c',
+    Action.BET: 'b',
+    Action.FOLD: 'f',
+    Action.CALL: 'c',
+}
+_CARD_CHAR: Dict[Card, str] = {card: card.name[0] for card in Card}  # J, Q, or K
+
+# Terminal histories: (winner, called). winner is the player who wins the pot
+# after a fold, or -1 for a showdown; called means the bet was matched, so
+# ante + bet_size is at stake instead of just the ante
+_TERMINAL: Dict[str, Tuple[int, bool]] = {
+    "cc": (-1, False),   # Both checked - showdown
+    "bf": (0, False),    # Player 0 bet, Player 1 folded
+    "cbf": (1, False),   # Player 0 checked, Player 1 bet, Player 0 folded
+    "bc": (-1, True),    # Player 0 bet, Player 1 called - showdown
+    "cbc": (-1, True),   # Player 0 checked, Player 1 bet, Player 0 called - showdown
+}
+
+# Number of bet_size chips put into the pot (bets and calls) after each history
+_NUM_BETS: Dict[str, int] = {
+    "": 0, "c": 0, "b": 1, "cc": 0, "cb": 1,
+    "bf": 1, "bc": 2, "cbf": 1, "cbc": 2,
+}
+
+# Player to act after each history of the game (player 0 moves first and
+# after "cb"); terminal histories keep the alternation. Any other history
+# falls back to the length rule in GameState.get_current_player
+_CURRENT_PLAYER: Dict[str, int] = {
+    "": 0, "c": 1, "b": 1, "cc": 0, "cb": 0,
+    "bf": 0, "bc": 0, "cbf": 1, "cbc": 1,
+}
 
 
 class GameState:
     """Represents the current state of a Kuhn Poker game"""
+    __slots__ = ('config', 'cards', 'history', 'pot')
+    
     def __init__(self, config: GameConfig, cards: List[Card], history: str = ""):
         self.config = config
         self.cards = cards  # cards[0] for player 0, cards[1] for player 1
@@ -49,67 +113,48 @@ class GameState:
     
     def is_terminal(self) -> bool:
         """Check if the game state is terminal"""
-        # Showdown after both check
-        if self.history == "cc":
-            return True
-        # Player 1 folds after Player 0 bets
-        if self.history == "bf":
-            return True
-        # Player 0 folds after Player 0 checks and Player 1 bets
-        if self.history == "cbf":
-            return True
-        # Showdown after call
-        if self.history == "bc" or self.history == "cbc":
-            return True
-        return False
+        return self.history in _TERMINAL
     
     def get_payoff(self, player: int) -> float:
         """Get the payoff for a player at a terminal state"""
-        if not self.is_terminal():
+        terminal = _TERMINAL.get(self.history)
+        if terminal is None:
             raise ValueError("Cannot get payoff at non-terminal state")
         
-        if self.history == "cc":
-            # Both checked - showdown
-            if self.cards[0] > self.cards[1]:
-                return self.config.ante if player == 0 else -self.config.ante
-            else:
-                return -self.config.ante if player == 0 else self.config.ante
-        
-        elif self.history == "bf":
-            # Player 0 bet, Player 1 folded
-            return self.config.ante if player == 0 else -self.config.ante
-        
-        elif self.history == "cbf":
-            # Player 0 checked, Player 1 bet, Player 0 folded
-            return -self.config.ante if player == 0 else self.config.ante
-        
-        elif self.history == "bc":
-            # Player 0 bet, Player 1 called - showdown
-            total = self.config.ante + self.config.bet_size
-            if self.cards[0] > self.cards[1]:
-                return total if player == 0 else -total
-            else:
-                return -total if player == 0 else total
-        
-        elif self.history == "cbc":
-            # Player 0 checked, Player 1 bet, Player 0 called - showdown
-            total = self.config.ante + self.config.bet_size
-            if self.cards[0] > self.cards[1]:
-                return total if player == 0 else -total
-            else:
-                return -total if player == 0 else total
-        
-        return 0.0
+        winner, called = terminal
+        if winner < 0:
+            # Showdown: the higher card wins
+            winner = 0 if self.cards[0] > self.cards[1] else 1
+        total = self.config.ante + self.config.bet_size if called else self.config.ante
+        return total if player == winner else -total
+    
+    def get_pot(self) -> int:
+        """Get the chips in the pot: both antes plus every bet and call so far"""
+        return self.pot + _NUM_BETS[self.history] * self.config.bet_size
     
     def get_current_player(self) -> int:
         """Get the player who acts next"""
-        if len(self.history) == 0 or len(self.history) == 2:
-            return 0
-        else:
-            return 1
+        player = _CURRENT_PLAYER.get(self.history)
+        if player is None:
+            # Not a history of the game tree: player 0 acts after 0 or 2 actions
+            return 0 if len(self.history) in (0, 2) else 1
+        return player
     
-    def get_legal_actions(self) -> List[Action]:
-        """Get legal actions for the current state"""
+    def get_legal_actions(self) -> Tuple[Action, ...]:
+        """
+        Get legal actions for the current state.
+        
+        The returned tuple is cached per history and shared by all states
+        (it is immutable, so callers cannot corrupt the cache).
+        """
+        legal_actions = _LEGAL_ACTIONS.get(self.history)
+        if legal_actions is None:
+            legal_actions = tuple(self._compute_legal_actions())
+            _LEGAL_ACTIONS[self.history] = legal_actions
+        return legal_actions
+    
+    def _compute_legal_actions(self) -> List[Action]:
+        """Derive the legal actions from the history"""
         if self.is_terminal():
             return []
         
@@ -134,26 +179,116 @@ class GameState:
     
     def apply_action(self, action: Action) -> 'GameState':
         """Create a new state by applying an action"""
-        action_char = self._action_to_char(action)
-        new_history = self.history + action_char
-        return GameState(self.config, self.cards, new_history)
+        key = (self.history, action)
+        new_history = _NEXT_HISTORY.get(key)
+        if new_history is None:
+            new_history = self.history + self._action_to_char(action)
+            _NEXT_HISTORY[key] = new_history
+        return self.with_history(new_history)
+    
+    def with_history(self, history: str) -> 'GameState':
+        """
+        Create a state with the same deal but a different history.
+        
+        A Kuhn state is fully determined by (cards, history), so the new state
+        shares config and cards with this one and skips __init__.
+        """
+        state = GameState.__new__(GameState)
+        state.config = self.config
+        state.cards = self.cards
+        state.history = history
+        state.pot = self.pot
+        return state
     
     def get_info_set(self, player: int) -> str:
         """Get the information set string for a player"""
         # Information set includes player's card and action history
-        card_name = self.cards[player].name[0]  # J, Q, or K
-        return f"{card_name}{self.history}"
+        return _CARD_CHAR[self.cards[player]] + self.history
     
     @staticmethod
     def _action_to_char(action: Action) -> str:
         """Convert action to character for history string"""
-        if action == Action.CHECK:
-            return 'c'
-        elif action == Action.BET:
-            return 'b'
-        elif action == Action.FOLD:
-            return 'f'
-        elif action == Action.CALL:
-            return 'c'
-        return ''
+        return _ACTION_CHAR.get(action, '')
+
+
 
+class GameTree:
+    """
+    Flat, precomputed Kuhn Poker game tree.
+    
+    The betting tree is identical for every deal, so its structure is stored
+    once per history (nodes in DFS preorder, parents before children). Only the
+    information set ids and terminal payoffs depend on the cards, so those
+    arrays carry a leading deal axis. Trainers sweep these arrays instead of
+    building GameState objects on every iteration.
+    """
+    def __init__(self, config: GameConfig):
+        self.config = config
+        
+        # All ordered (card0, card1) deals; each is equally likely
+        self.deals = list(config.deals)
+        self.deal_index = {deal: d for d, deal in enumerate(self.deals)}
+        self.num_deals = len(self.deals)
+        self.deal_prob = np.full(self.num_deals, 1.0 / self.num_deals)
+        
+        # Betting structure (same for every deal), enumerated by DFS
+        self.histories: List[str] = []
+        parent: List[int] = []
+        parent_action: List[int] = []
+        player: List[int] = []
+        children: List[List[int]] = []
+        
+        def visit(state: GameState, parent_idx: int, action_idx: int) -> int:
+            node = len(self.histories)
+            self.histories.append(state.history)
+            parent.append(parent_idx)
+            parent_action.append(action_idx)
+            children.append([-1, -1])
+            
+            if state.is_terminal():
+                player.append(-1)
+            else:
+                player.append(state.get_current_player())
+                for i, action in enumerate(state.get_legal_actions()):
+                    children[node][i] = visit(state.apply_action(action), node, i)
+            return node
+        
+        visit(GameState(config, list(self.deals[0])), -1, -1)
+        
+        self.num_nodes = len(self.histories)
+        self.parent = np.array(parent)
+        self.parent_action = np.array(parent_action)
+        self.player = np.array(player)
+        self.children = np.array(children)
+        self.num_actions = (self.children >= 0).sum(axis=1)
+        self.is_terminal = self.player < 0
+        self.decision_nodes = np.flatnonzero(~self.is_terminal)  # Preorder
+        
+        # Per-deal information set ids and player-0 terminal payoffs
+        self.info_set_keys: List[str] = []
+        self.info_set_index: Dict[str, int] = {}
+        self.info_set_action_names: List[List[str]] = []  # e.g. ['CHECK', 'BET']
+        self.infoset = np.full((self.num_deals, self.num_nodes), -1)
+        self.payoff = np.full((self.num_deals, self.num_nodes), np.nan)
+        
+        for d, deal in enumerate(self.deals):
+            for node, history in enumerate(self.histories):
+                state = GameState(config, list(deal), history)
+                if self.is_terminal[node]:
+                    self.payoff[d, node] = state.get_payoff(player=0)
+                else:
+                    key = state.get_info_set(self.player[node])
+                    if key not in self.info_set_index:
+                        self.info_set_index[key] = len(self.info_set_keys)
+                        self.info_set_keys.append(key)
+                        self.info_set_action_names.append(
+                            [action.name for action in state.get_legal_actions()]
+                        )
+                    self.infoset[d, node] = self.info_set_index[key]
+        
+        self.num_info_sets = len(self.info_set_keys)
+        
+        # Acting player of each information set
+        self.info_set_player = np.zeros(self.num_info_sets, dtype=int)
+        for node in self.decision_nodes:
+            self.info_set_player[self.infoset[:, node]] = self.player[node]
@@ -2,7 +2,6 @@
 Main script to run CFR or CFR+ on Kuhn Poker and visualize results.
 """
 import numpy as np
-import matplotlib.pyplot as plt
 from kuhn_poker import GameConfig
 from cfr import CFRTrainer
 from cfr_plus import CFRPlusTrainer
@@ -53,6 +52,10 @@ def plot_convergence(expected_values: list, window_size: int = 100, nash_value:
         nash_value: Nash equilibrium value to plot as reference (if None, uses -1/18)
         config: Game configuration (for label)
     """
+    # Imported here so that training and importing this module do not pay
+    # for loading matplotlib unless a plot is made
+    import matplotlib.pyplot as plt
+    
     if nash_value is None:
         nash_value = -1/18
     
@@ -62,19 +65,16 @@ def plot_convergence(expected_values: list, window_size: int = 100, nash_value:
         config_label = f"ante={config.ante}, bet={config.bet_size}"
     iterations = range(1, len(expected_values) + 1)
     
-    # Calculate running average
-    running_avg = []
-    cumsum = 0
-    for i, val in enumerate(expected_values):
-        cumsum += val
-        running_avg.append(cumsum / (i + 1))
-    
-    # Calculate moving average for smoothing
-    moving_avg = []
-    for i in range(len(expected_values)):
-        start_idx = max(0, i - window_size + 1)
-        window = expected_values[start_idx:i + 1]
-        moving_avg.append(np.mean(window))
+    # Calculate running average (one cumulative sum over the values)
+    values = np.asarray(expected_values, dtype=np.float64)
+    cumsum = np.concatenate(([0.0], np.cumsum(values)))
+    counts = np.arange(1, values.size + 1)
+    running_avg = cumsum[1:] / counts
+    
+    # Calculate moving average for smoothing: differences of the cumulative
+    # sum over windows [start, i], shorter at the start of the series
+    starts = np.maximum(counts - window_size, 0)
+    moving_avg = (cumsum[1:] - cumsum[starts]) / (counts - starts)
     
     # Create figure with subplots
     fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10))
@@ -9,10 +9,114 @@ Key features:
 3. Actions with negative cumulative regret get zero weight
 4. Parameter-free: no learning rate tuning needed
 """
+import random
 import numpy as np
 import math
 from typing import Dict, List, Tuple
-from kuhn_poker import GameState, GameConfig, Action, Card
+from kuhn_poker import GameConfig, GameTree, Action, Card
+from cfr import AverageStrategyMixin  # Average-strategy accessors
+from _numba import njit  # Numba is optional; the solver then runs as plain Python
+
+
+@njit(cache=True)
+def solve_c_scale(R_plus: np.ndarray) -> float:
+    """
+    Find scale c > 0 such that average potential equals e.
+    
+    Constraint: (1/|A|) * sum_a exp((R_plus[a]²)/(2c)) = e
+    
+    Solved with Newton's method for u = R_max²/c, i.e. on the regrets scaled
+    by the largest one (x_a = R_plus[a]/R_max <= 1), so squaring never
+    overflows or underflows. The left-hand side is convex and increasing in
+    u, so from a start to the right of the root the iterates decrease
+    monotonically onto it. The start is the closed form for the largest
+    regret alone, u = 2 ln(|A|(e - 1) + 1), which is already the root when
+    only one regret is positive (for two actions: c = R² / (2 ln(2e - 1))).
+    
+    Since u only decreases, no exponent x_a² u / 2 ever exceeds its value at
+    the start, ln(|A|(e - 1) + 1), so exp() cannot overflow and no clamping
+    or bracketing is needed. Only c = R_max² / u itself is limited to the
+    float range (R_max between about 1e-154 and 1e154).
+    
+    Args:
+        R_plus: Array of nonnegative [R_{I,a}]_+ values
+        
+    Returns:
+        Scale parameter c
+    """
+    num_actions = R_plus.shape[0]
+    
+    # If all regrets are non-positive, return any positive c
+    r_max = np.max(R_plus)
+    if r_max <= 0.0:
+        return 1.0
+    
+    u = 2.0 * math.log(num_actions * (math.e - 1.0) + 1.0)
+    for _ in range(50):
+        # Sum of potentials minus |A|·e, and its derivative in u
+        excess = -num_actions * math.e
+        slope = 0.0
+        for a in range(num_actions):
+            x = R_plus[a] / r_max
+            half_sq = x * x / 2.0
+            potential = math.exp(half_sq * u)
+            excess += potential
+            slope += half_sq * potential
+        
+        if abs(excess) < 1e-10 * num_actions:  # Converged (average within 1e-10 of e)
+            break
+        u -= excess / slope
+    
+    return r_max * (r_max / u)
+
+
+@njit(cache=True)
+def normalhedge_strategies(info_sets: np.ndarray, regret_sum: np.ndarray,
+                           c_scale: np.ndarray, strategy: np.ndarray):
+    """
+    Compute the current NormalHedge strategy of several information sets.
+    
+    Formula:
+    σ_I(a) ∝ ([R_{I,a}]_+/c) * exp(([R_{I,a}]_+)²/(2c))
+    
+    Args:
+        info_sets: Ids of the information sets to update
+        regret_sum: Cumulative regrets, shape (num_info_sets, num_actions)
+        c_scale: Scale parameter of every info set (written)
+        strategy: Current strategy of every info set (written), same shape
+                  as regret_sum
+    """
+    num_actions = regret_sum.shape[1]
+    R_plus = np.empty(num_actions)
+    
+    for info_set in info_sets:
+        # Compute [R]_+ (positive part of cumulative regrets)
+        for a in range(num_actions):
+            R_plus[a] = max(regret_sum[info_set, a], 0.0)
+        
+        # Solve for scale parameter c
+        c = solve_c_scale(R_plus)
+        c_scale[info_set] = c
+        
+        # Compute NormalHedge weights
+        weight_sum = 0.0
+        for a in range(num_actions):
+            if R_plus[a] > 0:
+                # R²/(2c) as (R/c)·R/2, so R² is never formed; c from
+                # solve_c_scale keeps the exponent below ln(|A|(e - 1) + 1)
+                ratio = R_plus[a] / c
+                strategy[info_set, a] = ratio * math.exp(ratio * R_plus[a] / 2.0)
+            else:
+                strategy[info_set, a] = 0.0
+            weight_sum += strategy[info_set, a]
+        
+        # Normalize to get probability distribution
+        for a in range(num_actions):
+            if weight_sum > 0:
+                strategy[info_set, a] /= weight_sum
+            else:
+                # All regrets non-positive: use uniform distribution
+                strategy[info_set, a] = 1.0 / num_actions
 
 
 class InformationSetNH:
@@ -26,6 +130,7 @@ class InformationSetNH:
         self.c_scale = 1.0  # NH scale parameter c_I
         self.strategy = np.ones(num_actions) / num_actions  # Current strategy
         self.strategy_sum = np.zeros(num_actions)  # For computing average strategy
+        self._buf = np.empty(num_actions)  # Scratch space for update_strategy_sum
     
     def normalhedge_weight(self, R_plus: np.ndarray, c: float) -> np.ndarray:
         """
@@ -40,17 +145,11 @@ class InformationSetNH:
         Returns:
             Unnormalized weights for each action
         """
-        weights = np.zeros(self.num_actions)
-        for i in range(self.num_actions):
-            if R_plus[i] > 0:
-                # Compute (R/c) * exp(R²/(2c))
-                exponent = (R_plus[i] * R_plus[i]) / (2.0 * c)
-                # Numerical stability: clamp exponent to prevent overflow
-                exponent = min(exponent, 700.0)  # exp(700) is near max float
-                weights[i] = (R_plus[i] / c) * math.exp(exponent)
-            else:
-                weights[i] = 0.0
-        return weights
+        # One pass over all actions; R = 0 gets zero weight from the R/c factor.
+        # The exponent R²/(2c) is computed as (R/c)·R/2, and stays below
+        # ln(|A|(e - 1) + 1) for c from solve_c_scale
+        ratio = R_plus / c
+        return ratio * np.exp(ratio * R_plus / 2.0)
     
     def solve_c_scale(self, R_plus: np.ndarray) -> float:
         """
@@ -58,7 +157,7 @@ class InformationSetNH:
         
         Constraint: (1/|A|) * sum_a exp((R_plus[a]²)/(2c)) = e
         
-        Uses bisection search. The left-hand side is monotone decreasing in c.
+        Uses Newton's method (the compiled module-level solve_c_scale).
         
         Args:
             R_plus: Array of nonnegative [R_{I,a}]_+ values
@@ -66,50 +165,7 @@ class InformationSetNH:
         Returns:
             Scale parameter c
         """
-        # If all regrets are non-positive, return any positive c
-        if np.max(R_plus) <= 0.0:
-            return 1.0
-        
-        def avg_potential(c: float) -> float:
-            """Compute average potential for given c."""
-            total = 0.0
-            for rp in R_plus:
-                exponent = (rp * rp) / (2.0 * c)
-                # Numerical stability: clamp exponent
-                exponent = min(exponent, 700.0)
-                total += math.exp(exponent)
-            return total / len(R_plus)
-        
-        # Find brackets [c_lo, c_hi] such that avg_potential(c_lo) > e > avg_potential(c_hi)
-        c_lo = 1e-12
-        c_hi = 1.0
-        
-        # Expand c_hi until avg_potential(c_hi) < e
-        max_iterations = 100
-        for _ in range(max_iterations):
-            if avg_potential(c_hi) <= math.e:
-                break
-            c_hi *= 2.0
-            if c_hi > 1e12:
-                c_hi = 1e12
-                break
-        
-        # Bisection search
-        for _ in range(60):
-            c_mid = 0.5 * (c_lo + c_hi)
-            val = avg_potential(c_mid)
-            
-            if abs(val - math.e) < 1e-10:  # Converged
-                return c_mid
-            
-            if val > math.e:
-                # Need larger c to reduce potential
-                c_lo = c_mid
-            else:
-                # Need smaller c to increase potential
-                c_hi = c_mid
-        
-        return 0.5 * (c_lo + c_hi)
+        return solve_c_scale(R_plus)
     
     def get_strategy(self) -> np.ndarray:
         """
@@ -161,7 +217,9 @@ class InformationSetNH:
         Args:
             reach_prob: Current player's reach probability to this infoset
         """
-        self.strategy_sum += reach_prob * self.strategy
+        # Multiply into a preallocated buffer rather than a new temporary
+        np.multiply(self.strategy, reach_prob, out=self._buf)
+        self.strategy_sum += self._buf
     
     def get_average_strategy(self) -> np.ndarray:
         """
@@ -177,7 +235,7 @@ class InformationSetNH:
             return np.ones(self.num_actions) / self.num_actions
 
 
-class NormalHedgeTrainer:
+class NormalHedgeTrainer(AverageStrategyMixin):
     """
     NormalHedge trainer for Kuhn Poker.
     
@@ -197,143 +255,155 @@ class NormalHedgeTrainer:
             config: Game configuration
         """
         self.config = config
-        self.info_sets: Dict[str, InformationSetNH] = {}
         self.iteration = 0
+        
+        # The recursion walks the precomputed game tree by (deal, node) index
+        # instead of allocating GameState objects. Its arrays are copied to
+        # nested lists once, since indexing a list with Python ints is much
+        # faster than indexing a NumPy array element by element.
+        self.tree = GameTree(config)
+        self._children = self.tree.children.tolist()
+        self._num_actions = self.tree.num_actions.tolist()
+        self._player = self.tree.player.tolist()  # -1 at terminal nodes
+        self._payoff = self.tree.payoff.tolist()  # [deal][node], player 0
+        self._infoset = self.tree.infoset.tolist()  # [deal][node], -1 at terminals
+        # Action value buffer for every node. A node appears at most once on
+        # the recursion stack, so each call can reuse its node's buffer
+        # instead of allocating a fresh array.
+        self._action_utilities = [np.empty(n) for n in self._num_actions]
+        
+        # Cumulative regrets and strategies, one row per tree info set id as
+        # in CFRTrainer (instead of one InformationSetNH object per info set)
+        num_info_sets = self.tree.num_info_sets
+        self.regret_sum = np.zeros((num_info_sets, 2))
+        self.strategy_sum = np.zeros((num_info_sets, 2))
+        self.c_scale = np.ones(num_info_sets)  # NH scale parameter c_I
+        self._strategy = np.full((num_info_sets, 2), 0.5)  # Current strategy
+        self._buf = np.empty(2)  # Scratch space for the strategy_sum update
+        
+        # Info sets of every deal. A traversal visits each of them exactly
+        # once and only updates an info set's regrets after reading its
+        # strategy, so all of their strategies can be solved in one batch
+        # before the traversal.
+        self._deal_info_sets = [
+            np.unique(row[row >= 0]) for row in self.tree.infoset
+        ]
     
-    def get_info_set(self, key: str, num_actions: int) -> InformationSetNH:
-        """Get or create an information set."""
-        if key not in self.info_sets:
-            self.info_sets[key] = InformationSetNH(num_actions)
-        return self.info_sets[key]
+    def get_info_sets(self) -> Dict[str, InformationSetNH]:
+        """
+        Build InformationSetNH objects for the trainer's information sets.
+        
+        New objects are built on every call. Their regret_sum, strategy and
+        strategy_sum are views of the trainer's rows (writes go through to the
+        trainer), while c_scale is a copy of the current scale parameter and
+        does not follow later training.
+        """
+        info_sets = {}
+        for i, key in enumerate(self.tree.info_set_keys):
+            info_set = InformationSetNH(self.regret_sum.shape[1])
+            info_set.regret_sum = self.regret_sum[i]
+            info_set.c_scale = float(self.c_scale[i])
+            info_set.strategy = self._strategy[i]
+            info_set.strategy_sum = self.strategy_sum[i]
+            info_sets[key] = info_set
+        return info_sets
     
-    def train(self, num_iterations: int) -> List[float]:
+    def train(self, num_iterations: int, verbose: bool = True) -> np.ndarray:
         """
         Train the NormalHedge algorithm for a number of iterations.
         
         Args:
             num_iterations: Number of training iterations
+            verbose: Print progress every 1000 iterations
             
         Returns:
-            List of expected game values per iteration (for player 0)
+            Array of expected game values per iteration (for player 0)
         """
-        expected_values = []
+        expected_values = np.empty(num_iterations)
         
         for i in range(num_iterations):
-            self.iteration = i
-            
-            # Deal random cards
-            deck = self.config.get_deck()
-            cards = [deck[0], deck[1]]
+            # Deal random cards: a uniformly drawn index into the tree's deals
+            # (config.sample_deal() without the card -> index lookup)
+            deal = random.randrange(self.tree.num_deals)
             
-            # Create initial game state
-            initial_state = GameState(self.config, cards)
+            # Solve the current strategies of the deal's info sets in one batch
+            normalhedge_strategies(self._deal_info_sets[deal], self.regret_sum, self.c_scale, self._strategy)
             
             # Run NormalHedge for both players
-            value = self.normalhedge_cfr(initial_state, reach_prob_0=1.0, reach_prob_1=1.0)
-            expected_values.append(value)
+            value = self.normalhedge_cfr(deal, 0, reach_prob_0=1.0, reach_prob_1=1.0)
+            expected_values[i] = value
             
-            if (i + 1) % 1000 == 0:
+            if verbose and (i + 1) % 1000 == 0:
                 print(f"Iteration {i + 1}/{num_iterations} - Expected value: {value:.6f}")
         
+        self.iteration += num_iterations  # Counted across calls
+        
         return expected_values
     
-    def normalhedge_cfr(self, state: GameState, reach_prob_0: float, reach_prob_1: float) -> float:
+    def normalhedge_cfr(self, deal: int, node: int, reach_prob_0: float, reach_prob_1: float) -> float:
         """
         Recursive NormalHedge-CFR algorithm.
         
         Similar to vanilla CFR but uses NormalHedge for strategy computation.
         
         Args:
-            state: Current game state
+            deal: Index of the dealt cards in self.tree.deals
+            node: Game tree node (history) reached; 0 is the root
             reach_prob_0: Probability that player 0's strategy reaches this state
             reach_prob_1: Probability that player 1's strategy reaches this state
             
         Returns:
             Expected utility for player 0
         """
+        player = self._player[node]
+        
         # Terminal state - return payoff
-        if state.is_terminal():
-            return state.get_payoff(player=0)
+        if player < 0:
+            return self._payoff[deal][node]
         
-        player = state.get_current_player()
-        info_set_key = state.get_info_set(player)
-        legal_actions = state.get_legal_actions()
-        num_actions = len(legal_actions)
+        info_set = self._infoset[deal][node]
+        children = self._children[node]
+        num_actions = self._num_actions[node]
         
-        # Get or create information set
-        info_set = self.get_info_set(info_set_key, num_actions)
-        strategy = info_set.get_strategy()
+        # Current strategy, solved by train() before the traversal
+        strategy = self._strategy[info_set]
         
         # Reach probability for the opponent
         opponent_reach_prob = reach_prob_1 if player == 0 else reach_prob_0
         
         # Calculate counterfactual action values
-        action_utilities = np.zeros(num_actions)
-        for i, action in enumerate(legal_actions):
-            next_state = state.apply_action(action)
+        action_utilities = self._action_utilities[node]  # Every entry is filled below
+        for i in range(num_actions):
+            next_node = children[i]
             
             if player == 0:
                 action_utilities[i] = self.normalhedge_cfr(
-                    next_state,
+                    deal, next_node,
                     reach_prob_0 * strategy[i],
                     reach_prob_1
                 )
             else:
                 # For player 1, negate the utility (since cfr returns player 0's utility)
                 action_utilities[i] = -self.normalhedge_cfr(
-                    next_state,
+                    deal, next_node,
                     reach_prob_0,
                     reach_prob_1 * strategy[i]
                 )
         
         # Expected utility for this information set
-        expected_utility = np.sum(strategy * action_utilities)
+        expected_utility = float(strategy @ action_utilities)
         
         # Update regrets using counterfactual regret
         # r_{I,a} = v_I(a) - v_I(σ_I) (utility space)
         # For NormalHedge, we use the regret identity directly.
         # The loss conversion ℓ_{I,a} = (1 - r_{I,a})/2 preserves action ordering,
         # so we can work directly with regrets (only the relative ordering matters for NH).
-        for i in range(num_actions):
-            regret = action_utilities[i] - expected_utility
-            info_set.add_regret(i, opponent_reach_prob * regret)
+        self.regret_sum[info_set] += opponent_reach_prob * (action_utilities - expected_utility)
         
-        # Update strategy sum (for computing average strategy)
+        # Update strategy sum (for computing average strategy), multiplying
+        # into a preallocated buffer rather than a new temporary
         current_reach_prob = reach_prob_0 if player == 0 else reach_prob_1
-        info_set.update_strategy_sum(current_reach_prob)
+        np.multiply(strategy, current_reach_prob, out=self._buf)
+        self.strategy_sum[info_set] += self._buf
         
         return expected_utility if player == 0 else -expected_utility
-    
-    def get_strategy_profile(self) -> Dict[str, Dict[str, float]]:
-        """
-        Get the average strategy for all information sets in a readable format.
-        
-        Returns:
-            Dictionary mapping infoset keys to action probability dictionaries
-        """
-        profile = {}
-        
-        for info_set_key, info_set in self.info_sets.items():
-            avg_strategy = info_set.get_average_strategy()
-            
-            # Determine possible actions based on history
-            history = info_set_key[1:]  # Remove card character
-            
-            if len(history) == 0:
-                action_names = ["CHECK", "BET"]
-            elif history == "c":
-                action_names = ["CHECK", "BET"]
-            elif history == "b":
-                action_names = ["FOLD", "CALL"]
-            elif history == "cb":
-                action_names = ["FOLD", "CALL"]
-            else:
-                action_names = [f"Action{i}" for i in range(len(avg_strategy))]
-            
-            profile[info_set_key] = {
-                action_names[i]: float(avg_strategy[i])
-                for i in range(len(avg_strategy))
-            }
-        
-        return profile
-
@@ -17,10 +17,296 @@ Expected improvement:
 - Better "forgetting" of past poor performance
 - Similar order-of-magnitude speedup as CFR+ vs CFR
 """
+import random
 import numpy as np
 import math
 from typing import Dict, List, Tuple
-from kuhn_poker import GameState, GameConfig, Action, Card
+from kuhn_poker import GameConfig, GameTree, Action, Card
+from cfr import AverageStrategyMixin  # Average-strategy accessors
+from normal_hedge import solve_c_scale  # Same scale constraint as NormalHedge
+from _numba import njit  # Numba is optional; the kernels then run as plain Python
+
+
+@njit(cache=True)
+def normalhedge_weights(R_plus: np.ndarray, c: float, weights: np.ndarray):
+    """
+    Write the unnormalized NormalHedge weights (R_plus[a]/c) * exp((R_plus[a]²)/(2c)).
+    
+    Args:
+        R_plus: Nonnegative cumulative regrets of one information set
+        c: Scale parameter
+        weights: Output buffer with the same shape as R_plus
+    """
+    for a in range(R_plus.shape[0]):
+        if R_plus[a] > 0:
+            # R²/(2c) as (R/c)·R/2, so R² is never formed; c from
+            # solve_c_scale keeps the exponent below ln(|A|(e - 1) + 1)
+            ratio = R_plus[a] / c
+            weights[a] = ratio * math.exp(ratio * R_plus[a] / 2.0)
+        else:
+            weights[a] = 0.0
+
+
+@njit(cache=True)
+def normalhedge_plus_strategy(R_plus: np.ndarray, strategy: np.ndarray) -> float:
+    """
+    Write the NormalHedge+ strategy of one information set into strategy.
+    
+    Args:
+        R_plus: RM+ truncated cumulative regrets (always >= 0)
+        strategy: Output buffer with the same shape as R_plus
+        
+    Returns:
+        Scale parameter c solved for these regrets
+    """
+    c = solve_c_scale(R_plus)
+    normalhedge_weights(R_plus, c, strategy)
+    
+    # Normalize to get probability distribution
+    weight_sum = np.sum(strategy)
+    for a in range(strategy.shape[0]):
+        if weight_sum > 0:
+            strategy[a] /= weight_sum
+        else:
+            # All regrets non-positive: use uniform distribution
+            strategy[a] = 1.0 / strategy.shape[0]
+    return c
+
+
+@njit(cache=True)
+def normalhedge_plus_iteration(
+    deal: int,
+    decision_nodes: np.ndarray,
+    player: np.ndarray,
+    children: np.ndarray,
+    num_actions: np.ndarray,
+    infoset: np.ndarray,
+    payoff: np.ndarray,
+    regret_sum: np.ndarray,
+    strategy_sum: np.ndarray,
+    strategy: np.ndarray,
+    c_scale: np.ndarray,
+    stale: np.ndarray,
+    reach: np.ndarray,
+    utility: np.ndarray
+) -> float:
+    """
+    One NormalHedge+-CFR traversal of a single deal of a flat GameTree,
+    updating the truncated regrets and strategy sums in place.
+    
+    Instead of recursing, the tree is swept twice: the forward pass (preorder)
+    computes the current strategies and reach probabilities, the backward pass
+    (reverse preorder) computes utilities and updates regrets bottom-up. Each
+    information set occurs once per deal, so this matches the recursive form.
+    
+    Args:
+        deal: Index of the dealt cards in the tree's deals
+        decision_nodes, player, children, num_actions, infoset,
+        payoff: GameTree arrays
+        regret_sum: Truncated cumulative regrets, shape (num_info_sets, num_actions)
+        strategy_sum: Cumulative strategies, same shape
+        strategy: Current strategy of every information set, same shape
+        c_scale: NH scale parameter of every information set
+        stale: Whether an information set's regrets changed since its
+               strategy was last solved
+        reach: Scratch buffer, shape (num_nodes, 2)
+        utility: Scratch buffer, shape (num_nodes,)
+    
+    Returns:
+        Expected utility for player 0
+    """
+    # Forward pass: current strategies and reach probabilities
+    reach[0, 0] = 1.0
+    reach[0, 1] = 1.0
+    for node in decision_nodes:
+        p = player[node]
+        info_set = infoset[deal, node]
+        
+        # Re-solve the strategy only if the truncated regrets changed
+        if stale[info_set]:
+            c_scale[info_set] = normalhedge_plus_strategy(regret_sum[info_set], strategy[info_set])
+            stale[info_set] = False
+        
+        for a in range(num_actions[node]):
+            child = children[node, a]
+            reach[child, 0] = reach[node, 0]
+            reach[child, 1] = reach[node, 1]
+            reach[child, p] *= strategy[info_set, a]
+    
+    # Backward pass: utilities (player 0's perspective), regrets and strategy sums
+    for node in range(utility.shape[0]):
+        utility[node] = payoff[deal, node]
+    for n in range(len(decision_nodes) - 1, -1, -1):
+        node = decision_nodes[n]
+        p = player[node]
+        info_set = infoset[deal, node]
+        sign = 1.0 if p == 0 else -1.0
+        
+        # Expected utility for the acting player
+        expected_utility = 0.0
+        for a in range(num_actions[node]):
+            expected_utility += strategy[info_set, a] * (sign * utility[children[node, a]])
+        
+        # Update regrets using counterfactual regret with RM+ truncation
+        # r_{I,a} = v_I(a) - v_I(σ_I), weighted by the opponent's reach
+        for a in range(num_actions[node]):
+            action_utility = sign * utility[children[node, a]]
+            updated = max(regret_sum[info_set, a] + reach[node, 1 - p] * (action_utility - expected_utility), 0.0)
+            if updated != regret_sum[info_set, a]:
+                regret_sum[info_set, a] = updated
+                stale[info_set] = True
+        
+        # Update strategy sum (for computing average strategy)
+        for a in range(num_actions[node]):
+            strategy_sum[info_set, a] += reach[node, p] * strategy[info_set, a]
+        
+        utility[node] = sign * expected_utility
+    
+    return utility[0]
+
+
+@njit(cache=True)
+def normalhedge_plus_expected_iteration(
+    decision_nodes: np.ndarray,
+    player: np.ndarray,
+    children: np.ndarray,
+    num_actions: np.ndarray,
+    infoset: np.ndarray,
+    payoff: np.ndarray,
+    deal_prob: np.ndarray,
+    regret_sum: np.ndarray,
+    strategy_sum: np.ndarray,
+    strategy: np.ndarray,
+    c_scale: np.ndarray,
+    stale: np.ndarray,
+    reach: np.ndarray,
+    utility: np.ndarray
+) -> float:
+    """
+    One NormalHedge+-CFR iteration over every deal at once (vector-form CFR).
+    
+    All deals are swept with the strategy profile solved at the start of the
+    iteration. Regrets and strategy sums are the chance-weighted sums over
+    the deals in which an information set is reached, and the RM+ truncation
+    is applied once to the aggregated regrets, as in cfr_iteration.
+    
+    Args:
+        decision_nodes, player, children, num_actions, infoset, payoff,
+        deal_prob: GameTree arrays
+        regret_sum ... utility: As for normalhedge_plus_iteration
+    
+    Returns:
+        Expected utility for player 0
+    """
+    num_info_sets, max_actions = regret_sum.shape
+    num_deals = infoset.shape[0]
+    
+    # Current strategy of every information set whose regrets changed
+    for info_set in range(num_info_sets):
+        if stale[info_set]:
+            c_scale[info_set] = normalhedge_plus_strategy(regret_sum[info_set], strategy[info_set])
+            stale[info_set] = False
+    
+    # Instantaneous regrets, summed over the deals
+    regrets = np.zeros((num_info_sets, max_actions))
+    
+    value = 0.0
+    for d in range(num_deals):
+        # Forward pass: reach probabilities and strategy sums
+        reach[0, 0] = 1.0
+        reach[0, 1] = 1.0
+        for node in decision_nodes:
+            p = player[node]
+            info_set = infoset[d, node]
+            for a in range(num_actions[node]):
+                strategy_sum[info_set, a] += deal_prob[d] * reach[node, p] * strategy[info_set, a]
+                child = children[node, a]
+                reach[child, 0] = reach[node, 0]
+                reach[child, 1] = reach[node, 1]
+                reach[child, p] *= strategy[info_set, a]
+        
+        # Backward pass: utilities (player 0's perspective) and regrets
+        for node in range(utility.shape[0]):
+            utility[node] = payoff[d, node]
+        for n in range(len(decision_nodes) - 1, -1, -1):
+            node = decision_nodes[n]
+            p = player[node]
+            info_set = infoset[d, node]
+            sign = 1.0 if p == 0 else -1.0
+            
+            # Expected utility for the acting player
+            expected_utility = 0.0
+            for a in range(num_actions[node]):
+                expected_utility += strategy[info_set, a] * (sign * utility[children[node, a]])
+            
+            # Regrets weighted by chance and the opponent's reach probability
+            counterfactual_reach = deal_prob[d] * reach[node, 1 - p]
+            for a in range(num_actions[node]):
+                action_utility = sign * utility[children[node, a]]
+                regrets[info_set, a] += counterfactual_reach * (action_utility - expected_utility)
+            
+            utility[node] = sign * expected_utility
+        
+        value += deal_prob[d] * utility[0]
+    
+    # Apply the aggregated regrets with RM+ truncation
+    for info_set in range(num_info_sets):
+        for a in range(max_actions):
+            updated = max(regret_sum[info_set, a] + regrets[info_set, a], 0.0)
+            if updated != regret_sum[info_set, a]:
+                regret_sum[info_set, a] = updated
+                stale[info_set] = True
+    
+    return value
+
+
+@njit(cache=True)
+def normalhedge_plus_train(
+    deals: np.ndarray,
+    decision_nodes: np.ndarray,
+    player: np.ndarray,
+    children: np.ndarray,
+    num_actions: np.ndarray,
+    infoset: np.ndarray,
+    payoff: np.ndarray,
+    deal_prob: np.ndarray,
+    regret_sum: np.ndarray,
+    strategy_sum: np.ndarray,
+    strategy: np.ndarray,
+    c_scale: np.ndarray,
+    stale: np.ndarray,
+    reach: np.ndarray,
+    utility: np.ndarray
+) -> np.ndarray:
+    """
+    Run a whole training loop of NormalHedge+ iterations inside compiled code.
+    
+    Args:
+        deals: Deal traversed in each iteration (normalhedge_plus_iteration),
+               or -1 for the expectation over all deals
+               (normalhedge_plus_expected_iteration)
+        decision_nodes ... utility: As for normalhedge_plus_expected_iteration
+    
+    Returns:
+        Expected utility for player 0 of each iteration
+    """
+    num_iterations = len(deals)
+    expected_values = np.empty(num_iterations)
+    
+    for t in range(num_iterations):
+        if deals[t] < 0:
+            expected_values[t] = normalhedge_plus_expected_iteration(
+                decision_nodes, player, children, num_actions, infoset, payoff,
+                deal_prob, regret_sum, strategy_sum, strategy, c_scale, stale,
+                reach, utility
+            )
+        else:
+            expected_values[t] = normalhedge_plus_iteration(
+                deals[t], decision_nodes, player, children, num_actions,
+                infoset, payoff, regret_sum, strategy_sum, strategy,
+                c_scale, stale, reach, utility
+            )
+    return expected_values
 
 
 class InformationSetNHPlus:
@@ -35,6 +321,7 @@ class InformationSetNHPlus:
         self.c_scale = 1.0  # NH scale parameter c_I
         self.strategy = np.ones(num_actions) / num_actions  # Current strategy
         self.strategy_sum = np.zeros(num_actions)  # For computing average strategy
+        self._buf = np.empty(num_actions)  # Scratch space for update_strategy_sum
     
     def normalhedge_weight(self, R_plus: np.ndarray, c: float) -> np.ndarray:
         """
@@ -52,16 +339,8 @@ class InformationSetNHPlus:
         Returns:
             Unnormalized weights for each action
         """
-        weights = np.zeros(self.num_actions)
-        for i in range(self.num_actions):
-            if R_plus[i] > 0:
-                # Compute (R/c) * exp(R²/(2c))
-                exponent = (R_plus[i] * R_plus[i]) / (2.0 * c)
-                # Numerical stability: clamp exponent to prevent overflow
-                exponent = min(exponent, 700.0)  # exp(700) is near max float
-                weights[i] = (R_plus[i] / c) * math.exp(exponent)
-            else:
-                weights[i] = 0.0
+        weights = np.empty(self.num_actions)
+        normalhedge_weights(np.asarray(R_plus, dtype=np.float64), c, weights)
         return weights
     
     def solve_c_scale(self, R_plus: np.ndarray) -> float:
@@ -70,7 +349,8 @@ class InformationSetNHPlus:
         
         Constraint: (1/|A|) * sum_a exp((R_plus[a]²)/(2c)) = e
         
-        Uses bisection search. The left-hand side is monotone decreasing in c.
+        Solved with Newton's method in 1/c (closed form when only one regret
+        is positive), see the solve_c_scale kernel.
         
         Args:
             R_plus: Array of nonnegative R'_{I,a} values (already truncated)
@@ -78,50 +358,7 @@ class InformationSetNHPlus:
         Returns:
             Scale parameter c
         """
-        # If all regrets are non-positive, return any positive c
-        if np.max(R_plus) <= 0.0:
-            return 1.0
-        
-        def avg_potential(c: float) -> float:
-            """Compute average potential for given c."""
-            total = 0.0
-            for rp in R_plus:
-                exponent = (rp * rp) / (2.0 * c)
-                # Numerical stability: clamp exponent
-                exponent = min(exponent, 700.0)
-                total += math.exp(exponent)
-            return total / len(R_plus)
-        
-        # Find brackets [c_lo, c_hi] such that avg_potential(c_lo) > e > avg_potential(c_hi)
-        c_lo = 1e-12
-        c_hi = 1.0
-        
-        # Expand c_hi until avg_potential(c_hi) < e
-        max_iterations = 100
-        for _ in range(max_iterations):
-            if avg_potential(c_hi) <= math.e:
-                break
-            c_hi *= 2.0
-            if c_hi > 1e12:
-                c_hi = 1e12
-                break
-        
-        # Bisection search
-        for _ in range(60):
-            c_mid = 0.5 * (c_lo + c_hi)
-            val = avg_potential(c_mid)
-            
-            if abs(val - math.e) < 1e-10:  # Converged
-                return c_mid
-            
-            if val > math.e:
-                # Need larger c to reduce potential
-                c_lo = c_mid
-            else:
-                # Need smaller c to increase potential
-                c_hi = c_mid
-        
-        return 0.5 * (c_lo + c_hi)
+        return solve_c_scale(np.asarray(R_plus, dtype=np.float64))
     
     def get_strategy(self) -> np.ndarray:
         """
@@ -137,21 +374,11 @@ class InformationSetNHPlus:
         """
         # In NormalHedge+, regret_sum is already truncated (always >= 0)
         # So we don't need the max operation
-        R_plus = self.regret_sum
-        
-        # Solve for scale parameter c
-        self.c_scale = self.solve_c_scale(R_plus)
-        
-        # Compute NormalHedge weights
-        weights = self.normalhedge_weight(R_plus, self.c_scale)
-        
-        # Normalize to get probability distribution
-        weight_sum = np.sum(weights)
-        if weight_sum > 0:
-            self.strategy = weights / weight_sum
-        else:
-            # All regrets non-positive: use uniform distribution
-            self.strategy = np.ones(self.num_actions) / self.num_actions
+        # Solve for scale parameter c, then normalize the NormalHedge weights
+        # (uniform if all regrets are zero)
+        strategy = np.empty(self.num_actions)
+        self.c_scale = normalhedge_plus_strategy(self.regret_sum, strategy)
+        self.strategy = strategy
         
         return self.strategy
     
@@ -182,7 +409,9 @@ class InformationSetNHPlus:
         Args:
             reach_prob: Current player's reach probability to this infoset
         """
-        self.strategy_sum += reach_prob * self.strategy
+        # Multiply into a preallocated buffer rather than a new temporary
+        np.multiply(self.strategy, reach_prob, out=self._buf)
+        self.strategy_sum += self._buf
     
     def get_average_strategy(self) -> np.ndarray:
         """
@@ -198,7 +427,7 @@ class InformationSetNHPlus:
             return np.ones(self.num_actions) / self.num_actions
 
 
-class NormalHedgePlusTrainer:
+class NormalHedgePlusTrainer(AverageStrategyMixin):
     """
     NormalHedge+ trainer for Kuhn Poker.
     
@@ -215,153 +444,96 @@ class NormalHedgePlusTrainer:
     - No parameters to tune (scale c_t computed automatically)
     - Still maintains the RM+ truncation structure
     """
-    def __init__(self, config: GameConfig):
+    def __init__(self, config: GameConfig, all_deals: bool = False):
         """
         Initialize NormalHedge+ trainer.
         
         Args:
             config: Game configuration
+            all_deals: Take the expectation over all card deals in each
+                       iteration (vector-form, as CFRTrainer does) instead of
+                       sampling one deal
         """
         self.config = config
-        self.info_sets: Dict[str, InformationSetNHPlus] = {}
+        self.all_deals = all_deals
         self.iteration = 0
+        
+        # Training sweeps the precomputed game tree in the compiled kernels
+        # above instead of recursing over GameState objects
+        self.tree = GameTree(config)
+        
+        # Truncated cumulative regrets and strategies, one row per tree info
+        # set id as in CFRTrainer (instead of InformationSetNHPlus objects)
+        num_info_sets = self.tree.num_info_sets
+        self.regret_sum = np.zeros((num_info_sets, 2))
+        self.strategy_sum = np.zeros((num_info_sets, 2))
+        self.c_scale = np.ones(num_info_sets)  # NH scale parameter c_I
+        self._strategy = np.full((num_info_sets, 2), 0.5)  # Current strategy
+        
+        # Whether an info set's regrets changed since its strategy was last
+        # solved. Zero reach and RM+ truncation leave the regrets unchanged on
+        # roughly half of all visits, and then the cached strategy is reused.
+        self._stale = np.ones(num_info_sets, dtype=bool)
+        
+        # Scratch buffers reused by every traversal
+        self._reach = np.ones((self.tree.num_nodes, 2))
+        self._utility = np.zeros(self.tree.num_nodes)
     
-    def get_info_set(self, key: str, num_actions: int) -> InformationSetNHPlus:
-        """Get or create an information set."""
-        if key not in self.info_sets:
-            self.info_sets[key] = InformationSetNHPlus(num_actions)
-        return self.info_sets[key]
-    
-    def train(self, num_iterations: int) -> List[float]:
+    def train(self, num_iterations: int, verbose: bool = True) -> np.ndarray:
         """
         Train the NormalHedge+ algorithm for a number of iterations.
         
         Args:
             num_iterations: Number of training iterations
+            verbose: Print progress every 1000 iterations
             
         Returns:
-            List of expected game values per iteration (for player 0)
+            Array of expected game values per iteration (for player 0)
         """
-        expected_values = []
+        tree = self.tree
+        num_deals = tree.num_deals
         
-        for i in range(num_iterations):
-            self.iteration = i
-            
-            # Deal random cards
-            deck = self.config.get_deck()
-            cards = [deck[0], deck[1]]
-            
-            # Create initial game state
-            initial_state = GameState(self.config, cards)
-            
-            # Run NormalHedge+ for both players
-            value = self.normalhedge_plus_cfr(initial_state, reach_prob_0=1.0, reach_prob_1=1.0)
-            expected_values.append(value)
-            
-            if (i + 1) % 1000 == 0:
-                print(f"Iteration {i + 1}/{num_iterations} - Expected value: {value:.6f}")
+        if self.all_deals:
+            # Expectation over all deals in every iteration
+            deals = np.full(num_iterations, -1)
+        else:
+            # Deal random cards: a uniformly drawn index into the tree's deals
+            # per iteration (config.sample_deal() without the card -> index lookup)
+            deals = np.array([random.randrange(num_deals) for _ in range(num_iterations)], dtype=np.int64)
+        
+        # Run NormalHedge+ for both players, with every iteration inside the
+        # compiled training loop
+        expected_values = normalhedge_plus_train(
+            deals, tree.decision_nodes, tree.player, tree.children, tree.num_actions,
+            tree.infoset, tree.payoff, tree.deal_prob, self.regret_sum, self.strategy_sum,
+            self._strategy, self.c_scale, self._stale, self._reach, self._utility
+        )
+        self.iteration += num_iterations  # Counted across calls
+        
+        # Progress report every 1000 iterations
+        if verbose:
+            for i in range(999, num_iterations, 1000):
+                print(f"Iteration {i + 1}/{num_iterations} - Expected value: {expected_values[i]:.6f}")
         
         return expected_values
     
-    def normalhedge_plus_cfr(self, state: GameState, reach_prob_0: float, reach_prob_1: float) -> float:
+    def normalhedge_plus_cfr(self, deal: int) -> float:
         """
-        Recursive NormalHedge+-CFR algorithm.
+        One NormalHedge+-CFR traversal of a single deal.
         
         Similar to vanilla CFR but uses NormalHedge+ for strategy computation
-        (NormalHedge weights with RM+ truncated cumulative regrets).
+        (NormalHedge weights with RM+ truncated cumulative regrets). The sweep
+        itself runs in the compiled kernels.
         
         Args:
-            state: Current game state
-            reach_prob_0: Probability that player 0's strategy reaches this state
-            reach_prob_1: Probability that player 1's strategy reaches this state
+            deal: Index of the dealt cards in self.tree.deals
             
         Returns:
             Expected utility for player 0
         """
-        # Terminal state - return payoff
-        if state.is_terminal():
-            return state.get_payoff(player=0)
-        
-        player = state.get_current_player()
-        info_set_key = state.get_info_set(player)
-        legal_actions = state.get_legal_actions()
-        num_actions = len(legal_actions)
-        
-        # Get or create information set
-        info_set = self.get_info_set(info_set_key, num_actions)
-        strategy = info_set.get_strategy()
-        
-        # Reach probability for the opponent
-        opponent_reach_prob = reach_prob_1 if player == 0 else reach_prob_0
-        
-        # Calculate counterfactual action values
-        action_utilities = np.zeros(num_actions)
-        for i, action in enumerate(legal_actions):
-            next_state = state.apply_action(action)
-            
-            if player == 0:
-                action_utilities[i] = self.normalhedge_plus_cfr(
-                    next_state,
-                    reach_prob_0 * strategy[i],
-                    reach_prob_1
-                )
-            else:
-                # For player 1, negate the utility (since cfr returns player 0's utility)
-                action_utilities[i] = -self.normalhedge_plus_cfr(
-                    next_state,
-                    reach_prob_0,
-                    reach_prob_1 * strategy[i]
-                )
-        
-        # Expected utility for this information set
-        expected_utility = np.sum(strategy * action_utilities)
-        
-        # Update regrets using counterfactual regret with RM+ truncation
-        # r_{I,a} = v_I(a) - v_I(σ_I) (utility space)
-        # For NormalHedge+, we use the regret identity directly.
-        # The loss conversion ℓ_{I,a} = (1 - r_{I,a})/2 preserves action ordering,
-        # so we can work directly with regrets (only the relative ordering matters for NH).
-        for i in range(num_actions):
-            regret = action_utilities[i] - expected_utility
-            # add_regret now applies RM+ truncation internally
-            info_set.add_regret(i, opponent_reach_prob * regret)
-        
-        # Update strategy sum (for computing average strategy)
-        current_reach_prob = reach_prob_0 if player == 0 else reach_prob_1
-        info_set.update_strategy_sum(current_reach_prob)
-        
-        return expected_utility if player == 0 else -expected_utility
-    
-    def get_strategy_profile(self) -> Dict[str, Dict[str, float]]:
-        """
-        Get the average strategy for all information sets in a readable format.
-        
-        Returns:
-            Dictionary mapping infoset keys to action probability dictionaries
-        """
-        profile = {}
-        
-        for info_set_key, info_set in self.info_sets.items():
-            avg_strategy = info_set.get_average_strategy()
-            
-            # Determine possible actions based on history
-            history = info_set_key[1:]  # Remove card character
-            
-            if len(history) == 0:
-                action_names = ["CHECK", "BET"]
-            elif history == "c":
-                action_names = ["CHECK", "BET"]
-            elif history == "b":
-                action_names = ["FOLD", "CALL"]
-            elif history == "cb":
-                action_names = ["FOLD", "CALL"]
-            else:
-                action_names = [f"Action{i}" for i in range(len(avg_strategy))]
-            
-            profile[info_set_key] = {
-                action_names[i]: float(avg_strategy[i])
-                for i in range(len(avg_strategy))
-            }
-        
-        return profile
-
+        tree = self.tree
+        return float(normalhedge_plus_iteration(
+            deal, tree.decision_nodes, tree.player, tree.children, tree.num_actions,
+            tree.infoset, tree.payoff, self.regret_sum, self.strategy_sum,
+            self._strategy, self.c_scale, self._stale, self._reach, self._utility
+        ))
@@ -3,7 +3,6 @@ Quick comparison of CFR, CFR+, NormalHedge, and NormalHedge+ with fewer iteratio
 This is a faster version for testing before running the full comparison.
 """
 import numpy as np
-import matplotlib.pyplot as plt
 from kuhn_poker import GameConfig
 from cfr import CFRTrainer
 from cfr_plus import CFRPlusTrainer
@@ -89,14 +88,15 @@ def quick_compare(num_iterations=2000):
     print(f"  Improvement over CFR: {(1 - nh_plus_error/cfr_error)*100:.1f}%")
     print(f"  Improvement over NormalHedge: {(1 - nh_plus_error/nh_error)*100:.1f}%")
     
-    # Plot convergence
+    # Plot convergence (matplotlib is only loaded once training is done)
+    import matplotlib.pyplot as plt
     plt.figure(figsize=(12, 6))
     
     iterations = range(1, num_iterations + 1)
     
-    # Running averages
+    # Running averages (one cumulative sum instead of a mean per prefix)
     def running_avg(vals):
-        return [np.mean(vals[:i+1]) for i in range(len(vals))]
+        return np.cumsum(np.asarray(vals, dtype=np.float64)) / np.arange(1, len(vals) + 1)
     
     plt.plot(iterations, running_avg(cfr_values), label='CFR', linewidth=2)
     plt.plot(iterations, running_avg(cfr_plus_values), label='CFR+', linewidth=2)
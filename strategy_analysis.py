@@ -3,14 +3,18 @@ Strategy Convergence Analysis
 Analyze how strategies converge to Nash equilibrium across iterations.
 """
 import numpy as np
-import matplotlib.pyplot as plt
 from kuhn_poker import GameConfig
 from cfr import CFRTrainer
 from cfr_plus import CFRPlusTrainer
 from normal_hedge import NormalHedgeTrainer
 from normal_hedge_plus import NormalHedgePlusTrainer
-import sys
-from io import StringIO
+import os
+import contextlib
+from experiment_cache import load_cached, save_cached
+
+# Resolution of the saved figure (override with the PLOT_DPI environment
+# variable)
+PLOT_DPI = int(os.environ.get('PLOT_DPI', '150'))
 
 # Nash equilibrium strategies for standard Kuhn Poker
 NASH_EQUILIBRIUM = {
@@ -38,30 +42,75 @@ NASH_EQUILIBRIUM = {
 
 def run_silent(trainer_class, config, num_iterations, **kwargs):
     """Run training silently."""
-    old_stdout = sys.stdout
-    sys.stdout = StringIO()
-    
     trainer = trainer_class(config, **kwargs) if kwargs else trainer_class(config)
-    trainer.train(num_iterations)
-    
-    sys.stdout = old_stdout
+    return train_silent(trainer, num_iterations)
+
+
+def train_silent(trainer, num_iterations):
+    """Continue training an existing trainer silently."""
+    # Progress output is discarded rather than buffered, and stdout is
+    # restored even if training raises
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        trainer.train(num_iterations)
     return trainer
 
 
+def train_checkpoints(trainer_class, config, checkpoints, **kwargs):
+    """
+    Train one algorithm and snapshot its strategy profile at each checkpoint.
+    
+    Finished runs are cached on disk (see experiment_cache), so a run done
+    before is loaded instead of retrained.
+    
+    Returns:
+        Dictionary mapping each checkpoint to the average strategy profile
+    """
+    key = ('strategy_analysis', trainer_class.__name__, config.ante, config.bet_size,
+           list(checkpoints), sorted(kwargs.items()))
+    profiles = load_cached(key, train_checkpoints)
+    if profiles is not None:
+        return profiles
+    
+    # One training run: train() continues from the current regrets, strategy
+    # sums and player alternation, so each checkpoint only trains the
+    # iterations since the previous one
+    trainer = trainer_class(config, **kwargs)
+    profiles = {}
+    iterations_done = 0
+    for checkpoint in checkpoints:
+        train_silent(trainer, checkpoint - iterations_done)
+        iterations_done = checkpoint
+        profiles[checkpoint] = trainer.get_strategy_profile()
+    save_cached(key, profiles, train_checkpoints)
+    
+    return profiles
+
+
+def flatten_strategy(nash):
+    """Flatten a strategy profile into (info set, action) keys and their probabilities."""
+    keys = [(info_set, action) for info_set, nash_strat in nash.items() for action in nash_strat]
+    return keys, np.array([nash[info_set][action] for info_set, action in keys], dtype=np.float64)
+
+
+# NASH_EQUILIBRIUM as fixed arrays, so distances are computed in NumPy
+_NASH_KEYS, _NASH_VEC = flatten_strategy(NASH_EQUILIBRIUM)
+
+
 def get_strategy_distance(profile, nash):
     """Calculate L2 distance between learned strategy and Nash equilibrium."""
-    total_distance = 0
-    count = 0
-    
-    for info_set, nash_strat in nash.items():
-        if info_set in profile:
-            learned = profile[info_set]
-            for action, nash_prob in nash_strat.items():
-                learned_prob = learned.get(action, 0)
-                total_distance += (nash_prob - learned_prob) ** 2
-                count += 1
-    
-    return np.sqrt(total_distance / count) if count > 0 else 0
+    if nash is NASH_EQUILIBRIUM:
+        keys, nash_vec = _NASH_KEYS, _NASH_VEC
+    else:
+        keys, nash_vec = flatten_strategy(nash)
+    
+    # Only info sets present in the learned profile are compared
+    present = np.fromiter((info_set in profile for info_set, _ in keys), dtype=bool, count=len(keys))
+    if not present.any():
+        return 0
+    learned = np.fromiter((profile.get(info_set, {}).get(action, 0) for info_set, action in keys),
+                          dtype=np.float64, count=len(keys))
+    
+    return float(np.sqrt(np.mean((nash_vec[present] - learned[present]) ** 2)))
 
 
 def analyze_strategy_convergence():
@@ -87,11 +136,11 @@ def analyze_strategy_convergence():
     
     for alg_name, trainer_class, kwargs in algorithms:
         print(f"\nAnalyzing {alg_name}...")
+        profiles = train_checkpoints(trainer_class, config, checkpoints, **kwargs)
         
         for checkpoint in checkpoints:
-            print(f"  Training for {checkpoint} iterations...", end=" ", flush=True)
-            trainer = run_silent(trainer_class, config, checkpoint, **kwargs)
-            profile = trainer.get_strategy_profile()
+            print(f"  Trained up to {checkpoint} iterations...", end=" ", flush=True)
+            profile = profiles[checkpoint]
             
             distance = get_strategy_distance(profile, NASH_EQUILIBRIUM)
             results[alg_name]['distances'].append(distance)
@@ -103,9 +152,11 @@ def analyze_strategy_convergence():
 
 def print_strategy_comparison_table(results, checkpoints):
     """Print detailed strategy comparison table."""
-    print("\n" + "="*80)
-    print("STRATEGY CONVERGENCE ANALYSIS")
-    print("="*80)
+    # Collected and printed in one write at the end
+    lines = []
+    lines.append("\n" + "="*80)
+    lines.append("STRATEGY CONVERGENCE ANALYSIS")
+    lines.append("="*80)
     
     # Key information sets to analyze
     key_info_sets = [
@@ -116,136 +167,112 @@ def print_strategy_comparison_table(results, checkpoints):
         ('Kb', 'CALL', 1.0, 'Call with King'),
     ]
     
-    print("\n--- Key Strategy Comparison (100K iterations) ---")
-    print(f"\n{'Info Set':<10} {'Action':<8} {'Nash':<8} {'CFR':<10} {'CFR+':<10} {'NH':<10} {'NH+':<10}")
-    print("-" * 70)
+    lines.append("\n--- Key Strategy Comparison (100K iterations) ---")
+    lines.append(f"\n{'Info Set':<10} {'Action':<8} {'Nash':<8} {'CFR':<10} {'CFR+':<10} {'NH':<10} {'NH+':<10}")
+    lines.append("-" * 70)
     
     final_checkpoint = checkpoints[-1]
+    final = {alg: results[alg]['strategies'][final_checkpoint]
+             for alg in ('CFR', 'CFR+', 'NormalHedge', 'NormalHedge+')}
     
     for info_set, action, nash_prob, description in key_info_sets:
-        cfr_prob = results['CFR']['strategies'][final_checkpoint].get(info_set, {}).get(action, 0)
-        cfrp_prob = results['CFR+']['strategies'][final_checkpoint].get(info_set, {}).get(action, 0)
-        nh_prob = results['NormalHedge']['strategies'][final_checkpoint].get(info_set, {}).get(action, 0)
-        nhp_prob = results['NormalHedge+']['strategies'][final_checkpoint].get(info_set, {}).get(action, 0)
+        cfr_prob = final['CFR'].get(info_set, {}).get(action, 0)
+        cfrp_prob = final['CFR+'].get(info_set, {}).get(action, 0)
+        nh_prob = final['NormalHedge'].get(info_set, {}).get(action, 0)
+        nhp_prob = final['NormalHedge+'].get(info_set, {}).get(action, 0)
         
-        print(f"{info_set:<10} {action:<8} {nash_prob:<8.3f} {cfr_prob:<10.4f} {cfrp_prob:<10.4f} {nh_prob:<10.4f} {nhp_prob:<10.4f}")
+        lines.append(f"{info_set:<10} {action:<8} {nash_prob:<8.3f} {cfr_prob:<10.4f} {cfrp_prob:<10.4f} {nh_prob:<10.4f} {nhp_prob:<10.4f}")
     
-    print("\n--- Distance from Nash Equilibrium ---")
-    print(f"\n{'Iterations':<12} {'CFR':<12} {'CFR+':<12} {'NH':<12} {'NH+':<12}")
-    print("-" * 60)
+    lines.append("\n--- Distance from Nash Equilibrium ---")
+    lines.append(f"\n{'Iterations':<12} {'CFR':<12} {'CFR+':<12} {'NH':<12} {'NH+':<12}")
+    lines.append("-" * 60)
     
     for i, checkpoint in enumerate(checkpoints):
         cfr_d = results['CFR']['distances'][i]
         cfrp_d = results['CFR+']['distances'][i]
         nh_d = results['NormalHedge']['distances'][i]
         nhp_d = results['NormalHedge+']['distances'][i]
-        print(f"{checkpoint:<12} {cfr_d:<12.4f} {cfrp_d:<12.4f} {nh_d:<12.4f} {nhp_d:<12.4f}")
+        lines.append(f"{checkpoint:<12} {cfr_d:<12.4f} {cfrp_d:<12.4f} {nh_d:<12.4f} {nhp_d:<12.4f}")
+    
+    print("\n".join(lines))
 
 
 def plot_strategy_convergence(results, checkpoints):
     """Create visualization of strategy convergence."""
-    fig, axes = plt.subplots(2, 3, figsize=(15, 10))
+    # Imported here so that the analysis itself does not pay for loading
+    # matplotlib
+    import matplotlib.pyplot as plt
     
+    # One shared (log-scaled) iteration axis for all panels
+    fig, axes = plt.subplots(2, 3, figsize=(15, 10), sharex=True)
+    
+    algorithms = ['CFR', 'CFR+', 'NormalHedge', 'NormalHedge+']
     colors = {'CFR': 'blue', 'CFR+': 'red', 'NormalHedge': 'purple', 'NormalHedge+': 'magenta'}
     
-    # Plot 1: Overall distance from Nash
-    ax = axes[0, 0]
-    for alg_name in ['CFR', 'CFR+', 'NormalHedge', 'NormalHedge+']:
-        ax.plot(checkpoints, results[alg_name]['distances'], 
-                marker='o', label=alg_name, color=colors[alg_name], linewidth=2)
-    ax.set_xlabel('Iterations')
-    ax.set_ylabel('L2 Distance from Nash')
-    ax.set_title('Overall Strategy Distance from Nash Equilibrium')
-    ax.set_xscale('log')
-    ax.legend()
-    ax.grid(True, alpha=0.3)
-    
-    # Plot 2: Jack bluffing probability (should be 1/3)
-    ax = axes[0, 1]
-    nash_j_bet = 1/3
-    for alg_name in ['CFR', 'CFR+', 'NormalHedge', 'NormalHedge+']:
-        probs = [results[alg_name]['strategies'][cp].get('J', {}).get('BET', 0) for cp in checkpoints]
-        ax.plot(checkpoints, probs, marker='o', label=alg_name, color=colors[alg_name], linewidth=2)
-    ax.axhline(y=nash_j_bet, color='black', linestyle='--', label='Nash (1/3)', linewidth=2)
-    ax.set_xlabel('Iterations')
-    ax.set_ylabel('Probability')
-    ax.set_title('Jack Bluffing Probability (Nash = 1/3)')
-    ax.set_xscale('log')
-    ax.legend()
-    ax.grid(True, alpha=0.3)
-    
-    # Plot 3: King betting probability (should be ~1)
-    ax = axes[0, 2]
-    for alg_name in ['CFR', 'CFR+', 'NormalHedge', 'NormalHedge+']:
-        probs = [results[alg_name]['strategies'][cp].get('K', {}).get('BET', 0) for cp in checkpoints]
-        ax.plot(checkpoints, probs, marker='o', label=alg_name, color=colors[alg_name], linewidth=2)
-    ax.axhline(y=1.0, color='black', linestyle='--', label='Nash (1.0)', linewidth=2)
-    ax.set_xlabel('Iterations')
-    ax.set_ylabel('Probability')
-    ax.set_title('King Value Betting Probability (Nash ≥ 2/3)')
-    ax.set_xscale('log')
-    ax.legend()
-    ax.grid(True, alpha=0.3)
-    
-    # Plot 4: Queen checking probability (should be 1)
-    ax = axes[1, 0]
-    for alg_name in ['CFR', 'CFR+', 'NormalHedge', 'NormalHedge+']:
-        probs = [results[alg_name]['strategies'][cp].get('Q', {}).get('CHECK', 0) for cp in checkpoints]
-        ax.plot(checkpoints, probs, marker='o', label=alg_name, color=colors[alg_name], linewidth=2)
-    ax.axhline(y=1.0, color='black', linestyle='--', label='Nash (1.0)', linewidth=2)
-    ax.set_xlabel('Iterations')
-    ax.set_ylabel('Probability')
-    ax.set_title('Queen Checking Probability (Nash = 1.0)')
-    ax.set_xscale('log')
-    ax.legend()
-    ax.grid(True, alpha=0.3)
-    
-    # Plot 5: Jack folding to bet (should be 1)
-    ax = axes[1, 1]
-    for alg_name in ['CFR', 'CFR+', 'NormalHedge', 'NormalHedge+']:
-        probs = [results[alg_name]['strategies'][cp].get('Jb', {}).get('FOLD', 0) for cp in checkpoints]
-        ax.plot(checkpoints, probs, marker='o', label=alg_name, color=colors[alg_name], linewidth=2)
-    ax.axhline(y=1.0, color='black', linestyle='--', label='Nash (1.0)', linewidth=2)
-    ax.set_xlabel('Iterations')
-    ax.set_ylabel('Probability')
-    ax.set_title('Jack Folding to Bet (Nash = 1.0)')
-    ax.set_xscale('log')
-    ax.legend()
-    ax.grid(True, alpha=0.3)
-    
-    # Plot 6: Queen calling with bet (should be 1/3)
-    ax = axes[1, 2]
-    nash_qb_call = 1/3
-    for alg_name in ['CFR', 'CFR+', 'NormalHedge', 'NormalHedge+']:
-        probs = [results[alg_name]['strategies'][cp].get('Qb', {}).get('CALL', 0) for cp in checkpoints]
-        ax.plot(checkpoints, probs, marker='o', label=alg_name, color=colors[alg_name], linewidth=2)
-    ax.axhline(y=nash_qb_call, color='black', linestyle='--', label='Nash (1/3)', linewidth=2)
-    ax.set_xlabel('Iterations')
-    ax.set_ylabel('Probability')
-    ax.set_title('Queen Calling a Bet (Nash = 1/3)')
-    ax.set_xscale('log')
-    ax.legend()
-    ax.grid(True, alpha=0.3)
+    # Plots 2-6: (info set, action, Nash value, title), in axes order
+    key_plots = [
+        ('J', 'BET', 1/3, 'Jack Bluffing Probability (Nash = 1/3)'),
+        ('K', 'BET', 1.0, 'King Value Betting Probability (Nash ≥ 2/3)'),
+        ('Q', 'CHECK', 1.0, 'Queen Checking Probability (Nash = 1.0)'),
+        ('Jb', 'FOLD', 1.0, 'Jack Folding to Bet (Nash = 1.0)'),
+        ('Qb', 'CALL', 1/3, 'Queen Calling a Bet (Nash = 1/3)'),
+    ]
+    
+    # Learned probability of every plotted action, extracted once as
+    # (algorithm, checkpoint, plot)
+    probs = np.array([
+        [[results[alg]['strategies'][cp].get(info_set, {}).get(action, 0)
+          for info_set, action, _, _ in key_plots]
+         for cp in checkpoints]
+        for alg in algorithms
+    ], dtype=np.float64)
+    distances = np.array([results[alg]['distances'] for alg in algorithms])
+    
+    # Every panel as (title, y label, (algorithm, checkpoint) series, Nash
+    # reference line). Plot 1 is the overall distance from Nash.
+    panels = [('Overall Strategy Distance from Nash Equilibrium', 'L2 Distance from Nash', distances, None)]
+    panels += [(title, 'Probability', probs[:, :, p], nash_prob)
+               for p, (_, _, nash_prob, title) in enumerate(key_plots)]
+    
+    for ax, (title, ylabel, series, nash_prob) in zip(axes.flat, panels):
+        for a, alg_name in enumerate(algorithms):
+            ax.plot(checkpoints, series[a], marker='o', label=alg_name, color=colors[alg_name], linewidth=2)
+        if nash_prob is not None:
+            ax.axhline(y=nash_prob, color='black', linestyle='--', label='Nash equilibrium', linewidth=2)
+        ax.set_ylabel(ylabel)
+        ax.set_title(title)
+        ax.grid(True, alpha=0.3)
+    
+    # The scale applies to all shared axes; only the bottom row is labelled
+    axes[0, 0].set_xscale('log')
+    for ax in axes[-1]:
+        ax.set_xlabel('Iterations')
+    
+    # One legend for all panels (the Nash values are in the panel titles)
+    handles, labels = axes[0, 1].get_legend_handles_labels()
+    fig.legend(handles, labels, loc='lower center', ncol=len(labels))
     
     plt.suptitle('Strategy Convergence to Nash Equilibrium', fontsize=14, fontweight='bold')
-    plt.tight_layout()
-    plt.savefig('strategy_convergence_analysis.png', dpi=300, bbox_inches='tight')
+    plt.tight_layout(rect=(0, 0.04, 1, 1))
+    plt.savefig('strategy_convergence_analysis.png', dpi=PLOT_DPI, bbox_inches='tight')
     print("\nSaved: strategy_convergence_analysis.png")
     plt.close()
 
 
 def generate_latex_table(results, checkpoints):
     """Generate LaTeX table for strategy convergence."""
-    print("\n\n--- LaTeX Table: Strategy Distance from Nash ---")
-    print(r"\begin{table}[t]")
-    print(r"\centering")
-    print(r"\caption{L2 distance from Nash equilibrium strategies across iterations.}")
-    print(r"\label{tab:strategy_distance}")
-    print(r"\small")
-    print(r"\begin{tabular}{rcccc}")
-    print(r"\toprule")
-    print(r"Iterations & CFR & CFR+ & NormalHedge & NormalHedge+ \\")
-    print(r"\midrule")
+    # Collected and printed in one write at the end
+    lines = []
+    lines.append("\n\n--- LaTeX Table: Strategy Distance from Nash ---")
+    lines.append(r"\begin{table}[t]")
+    lines.append(r"\centering")
+    lines.append(r"\caption{L2 distance from Nash equilibrium strategies across iterations.}")
+    lines.append(r"\label{tab:strategy_distance}")
+    lines.append(r"\small")
+    lines.append(r"\begin{tabular}{rcccc}")
+    lines.append(r"\toprule")
+    lines.append(r"Iterations & CFR & CFR+ & NormalHedge & NormalHedge+ \\")
+    lines.append(r"\midrule")
     
     for i, checkpoint in enumerate(checkpoints):
         cfr_d = results['CFR']['distances'][i]
@@ -261,23 +288,23 @@ def generate_latex_table(results, checkpoints):
                 return r"\textbf{" + f"{d:.4f}" + "}"
             return f"{d:.4f}"
         
-        print(f"{checkpoint:,} & {fmt(cfr_d)} & {fmt(cfrp_d)} & {fmt(nh_d)} & {fmt(nhp_d)} \\\\")
+        lines.append(f"{checkpoint:,} & {fmt(cfr_d)} & {fmt(cfrp_d)} & {fmt(nh_d)} & {fmt(nhp_d)} \\\\")
     
-    print(r"\bottomrule")
-    print(r"\end{tabular}")
-    print(r"\end{table}")
+    lines.append(r"\bottomrule")
+    lines.append(r"\end{tabular}")
+    lines.append(r"\end{table}")
     
     # Key strategies table
-    print("\n\n--- LaTeX Table: Key Strategy Comparison ---")
-    print(r"\begin{table}[t]")
-    print(r"\centering")
-    print(r"\caption{Learned strategies for key decision points (100K iterations). Bold indicates closest to Nash.}")
-    print(r"\label{tab:key_strategies}")
-    print(r"\small")
-    print(r"\begin{tabular}{llcccccc}")
-    print(r"\toprule")
-    print(r"Info Set & Action & Nash & CFR & CFR+ & NH & NH+ \\")
-    print(r"\midrule")
+    lines.append("\n\n--- LaTeX Table: Key Strategy Comparison ---")
+    lines.append(r"\begin{table}[t]")
+    lines.append(r"\centering")
+    lines.append(r"\caption{Learned strategies for key decision points (100K iterations). Bold indicates closest to Nash.}")
+    lines.append(r"\label{tab:key_strategies}")
+    lines.append(r"\small")
+    lines.append(r"\begin{tabular}{llcccccc}")
+    lines.append(r"\toprule")
+    lines.append(r"Info Set & Action & Nash & CFR & CFR+ & NH & NH+ \\")
+    lines.append(r"\midrule")
     
     key_info_sets = [
         ('J', 'BET', 1/3),
@@ -291,11 +318,13 @@ def generate_latex_table(results, checkpoints):
     ]
     
     final_cp = checkpoints[-1]
+    final = {alg: results[alg]['strategies'][final_cp]
+             for alg in ('CFR', 'CFR+', 'NormalHedge', 'NormalHedge+')}
     
     for info_set, action, nash_prob in key_info_sets:
         probs = {}
         for alg in ['CFR', 'CFR+', 'NormalHedge', 'NormalHedge+']:
-            probs[alg] = results[alg]['strategies'][final_cp].get(info_set, {}).get(action, 0)
+            probs[alg] = final[alg].get(info_set, {}).get(action, 0)
         
         # Find closest to Nash
         errors = {alg: abs(p - nash_prob) for alg, p in probs.items()}
@@ -307,11 +336,13 @@ def generate_latex_table(results, checkpoints):
                 return r"\textbf{" + f"{p:.3f}" + "}"
             return f"{p:.3f}"
         
-        print(f"{info_set} & {action} & {nash_prob:.3f} & {fmt('CFR')} & {fmt('CFR+')} & {fmt('NormalHedge')} & {fmt('NormalHedge+')} \\\\")
+        lines.append(f"{info_set} & {action} & {nash_prob:.3f} & {fmt('CFR')} & {fmt('CFR+')} & {fmt('NormalHedge')} & {fmt('NormalHedge+')} \\\\")
+    
+    lines.append(r"\bottomrule")
+    lines.append(r"\end{tabular}")
+    lines.append(r"\end{table}")
     
-    print(r"\bottomrule")
-    print(r"\end{tabular}")
-    print(r"\end{table}")
+    print("\n".join(lines))
 
 
 if __name__ == "__main__":
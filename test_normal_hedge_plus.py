@@ -2,9 +2,11 @@
 Test script to verify NormalHedge+ implementation.
 Demonstrates that RM+ truncation is working correctly.
 """
+import random
 import numpy as np
+from kuhn_poker import GameConfig
 from normal_hedge import InformationSetNH
-from normal_hedge_plus import InformationSetNHPlus
+from normal_hedge_plus import InformationSetNHPlus, NormalHedgePlusTrainer
 
 
 def test_regret_truncation():
@@ -119,10 +121,54 @@ def test_basic_functionality():
     print("="*70)
 
 
+def test_trainer_convergence():
+    """
+    Test that the NormalHedge+ trainer reaches the Kuhn Poker equilibrium
+    (game value -1/18 with ante 1, bet 1), with sampled deals and with the
+    expectation over all deals.
+    """
+    print("\n" + "="*70)
+    print("Testing NormalHedge+ trainer convergence")
+    print("="*70)
+    
+    config = GameConfig()
+    runs = {
+        "all deals": (True, 20000, 0.02),
+        "sampled deals": (False, 500000, 0.05),
+    }
+    
+    for name, (all_deals, num_iterations, tolerance) in runs.items():
+        random.seed(0)
+        trainer = NormalHedgePlusTrainer(config, all_deals=all_deals)
+        values = trainer.train(num_iterations, verbose=False)
+        profile = trainer.get_strategy_profile()
+        tail_value = np.mean(values[-num_iterations // 10:])
+        print(f"\n{name}: tail value {tail_value:.4f} (Nash: {-1/18:.4f})")
+        print(f"  Kb CALL: {profile['Kb']['CALL']:.4f}, Jb FOLD: {profile['Jb']['FOLD']:.4f}")
+        
+        # Player 1 always calls with K and folds J to a bet
+        assert profile["Kb"]["CALL"] > 1 - tolerance
+        assert profile["Jb"]["FOLD"] > 1 - tolerance
+        assert abs(tail_value - (-1/18)) < tolerance
+        print("  ✓ PASS")
+    
+    # Training in segments continues from the current regrets and strategy sums
+    single = NormalHedgePlusTrainer(config, all_deals=True)
+    single.train(1000, verbose=False)
+    segmented = NormalHedgePlusTrainer(config, all_deals=True)
+    for num_iterations in [333, 667]:
+        segmented.train(num_iterations, verbose=False)
+    assert np.array_equal(single.regret_sum, segmented.regret_sum)
+    assert np.array_equal(single.strategy_sum, segmented.strategy_sum)
+    assert segmented.iteration == 1000
+    print("\nSegmented all-deals training matches a single run: ✓ PASS")
+
+
 if __name__ == "__main__":
     # Run tests
     test_basic_functionality()
     test_regret_truncation()
+    test_trainer_convergence()
     
     print("\n" + "="*70)
     print("✓ ALL TESTS PASSED")